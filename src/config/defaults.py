@@ -122,6 +122,11 @@ DEFAULT_CONFIG = {
             "detection_confidence": 0.65,  # 稍微降低，更容易检测
             "tracking_confidence": 0.5,
             "max_hands": 1,  # 只追踪一只手
+            "tracking_width": 320,  # 送入 MediaPipe 前缩小到的最大宽度
+            "pipeline_inference": False,  # 推理与渲染并行（增加一帧延迟）
+            "cursor_output_hz": 0,  # 鼠标插值输出频率，0=关闭
+            "cv_threads": 2,  # OpenCV 线程数，0=单线程
+            "async_cursor": False,  # 鼠标移动在后台线程执行（不插值）
         },
     },
     # UI 设置
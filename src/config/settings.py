@@ -12,6 +12,10 @@ import yaml
 
 from .defaults import DEFAULT_CONFIG
 
+# 优先使用 libyaml 的 C 实现，解析/序列化快数倍（未编译 libyaml 时回退到纯 Python）
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 class Settings:
     """配置管理器"""
@@ -48,7 +52,7 @@ class Settings:
         if self.config_path.exists():
             try:
                 with open(self.config_path, "r", encoding="utf-8") as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=_YamlLoader) or {}
                 self._config = self._deep_merge(self._config, user_config)
             except Exception as e:
                 print(f"Warning: Failed to load config file: {e}")
@@ -60,14 +64,16 @@ class Settings:
         # 确保目录存在
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # 先序列化再写入，文件只在一次写操作期间处于打开状态
+        content = yaml.dump(
+            self._config,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
         with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.dump(
-                self._config,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            )
+            f.write(content)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -159,6 +165,10 @@ class Settings:
     def camera_height(self) -> int:
         return self.get("settings.camera.height", 480)
     
+    @property
+    def camera_fps(self) -> int:
+        return self.get("settings.camera.fps", 30)
+    
     @property
     def flip_x(self) -> bool:
         return self.get("settings.camera.flip_x", True)
@@ -187,6 +197,26 @@ class Settings:
     def tracking_confidence(self) -> float:
         return self.get("settings.performance.tracking_confidence", 0.5)
     
+    @property
+    def tracking_width(self) -> int:
+        return self.get("settings.performance.tracking_width", 320)
+    
+    @property
+    def pipeline_inference(self) -> bool:
+        return self.get("settings.performance.pipeline_inference", False)
+    
+    @property
+    def cursor_output_hz(self) -> int:
+        return self.get("settings.performance.cursor_output_hz", 0)
+    
+    @property
+    def cv_threads(self) -> int:
+        return self.get("settings.performance.cv_threads", 2)
+    
+    @property
+    def async_cursor(self) -> bool:
+        return self.get("settings.performance.async_cursor", False)
+    
     @property
     def show_visualizer(self) -> bool:
         return self.get("ui.show_visualizer", True)
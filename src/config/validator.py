@@ -191,6 +191,42 @@ DEFAULT_RULES: Dict[str, ValidationRule] = {
         max_value=1.0,
         default=0.5,
     ),
+    "settings.performance.tracking_width": ValidationRule(
+        key="settings.performance.tracking_width",
+        description="追踪图像最大宽度",
+        value_type=int,
+        min_value=160,
+        max_value=1920,
+        default=320,
+    ),
+    "settings.performance.pipeline_inference": ValidationRule(
+        key="settings.performance.pipeline_inference",
+        description="推理与渲染并行",
+        value_type=bool,
+        default=False,
+    ),
+    "settings.performance.cursor_output_hz": ValidationRule(
+        key="settings.performance.cursor_output_hz",
+        description="鼠标插值输出频率",
+        value_type=int,
+        min_value=0,
+        max_value=240,
+        default=0,
+    ),
+    "settings.performance.cv_threads": ValidationRule(
+        key="settings.performance.cv_threads",
+        description="OpenCV 线程数",
+        value_type=int,
+        min_value=0,
+        max_value=16,
+        default=2,
+    ),
+    "settings.performance.async_cursor": ValidationRule(
+        key="settings.performance.async_cursor",
+        description="后台线程移动鼠标",
+        value_type=bool,
+        default=False,
+    ),
     # UI 设置
     "ui.show_visualizer": ValidationRule(
         key="ui.show_visualizer",
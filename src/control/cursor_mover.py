@@ -0,0 +1,185 @@
+"""
+鼠标移动输出线程
+
+以固定频率（默认 120Hz）输出鼠标移动，在相邻目标点之间线性插值，
+使光标平滑程度不再受摄像头/推理帧率（30-60Hz）限制。
+也可关闭插值，仅将鼠标移动移出主循环。
+"""
+
+import threading
+import time
+from typing import Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CursorMover:
+    """
+    鼠标移动输出线程
+
+    主循环每帧通过 set_target() 提交新的目标点，输出线程在上一个目标点与
+    新目标点之间按两次提交的时间间隔线性插值，并以固定频率调用 move_to()。
+    插值会使光标落后约一个帧间隔；需要精确落点（点击前）时使用 jump_to()。
+    interpolate=False 时不插值，输出线程直接移动到最新目标点，未执行的旧目标点被丢弃。
+
+    Example:
+        >>> mover = CursorMover(mouse, rate_hz=120)
+        >>> mover.start()
+        >>> mover.set_target(100, 200)
+        >>> mover.stop()
+    """
+
+    # 插值时长上限（秒），避免长时间无目标后的第一段移动过慢
+    MAX_SEGMENT_DURATION = 0.1
+
+    def __init__(self, mouse, rate_hz: float = 120.0, interpolate: bool = True):
+        """
+        初始化输出线程
+
+        Args:
+            mouse: 鼠标控制器（需要 move_to(x, y) 方法）
+            rate_hz: 输出频率
+            interpolate: 是否在目标点之间插值
+        """
+        self._mouse = mouse
+        self._interval = 1.0 / max(1.0, rate_hz)
+        self._interpolate = interpolate
+
+        # 保护插值状态
+        self._lock = threading.Lock()
+        # 保证 move_to 不会被两个线程同时调用
+        self._move_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # 插值状态：从 _start_pos 到 _target_pos，时间 [_start_time, _start_time + _duration]
+        self._start_pos: Optional[tuple[float, float]] = None
+        self._target_pos: Optional[tuple[float, float]] = None
+        self._start_time = 0.0
+        self._duration = 0.0
+        self._last_target_time = 0.0
+        self._last_sent: Optional[tuple[int, int]] = None
+
+    @property
+    def is_running(self) -> bool:
+        """输出线程是否在运行"""
+        return self._running
+
+    def start(self):
+        """启动输出线程"""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="CursorMover", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """停止输出线程"""
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def set_target(self, x: int, y: int):
+        """
+        提交新的目标点
+
+        Args:
+            x: 屏幕 x 坐标
+            y: 屏幕 y 坐标
+        """
+        now = time.perf_counter()
+        with self._lock:
+            if self._target_pos is None or not self._interpolate:
+                # 第一个目标点（或不插值时）直接到达
+                self._start_pos = (float(x), float(y))
+                self._duration = 0.0
+            else:
+                self._start_pos = self._position_at(now)
+                self._duration = min(
+                    now - self._last_target_time, self.MAX_SEGMENT_DURATION
+                )
+            self._target_pos = (float(x), float(y))
+            self._start_time = now
+            self._last_target_time = now
+        self._wakeup.set()
+
+    def jump_to(self, x: int, y: int):
+        """
+        立即移动到指定位置并结束当前插值
+
+        Args:
+            x: 屏幕 x 坐标
+            y: 屏幕 y 坐标
+        """
+        now = time.perf_counter()
+        with self._lock:
+            self._start_pos = self._target_pos = (float(x), float(y))
+            self._start_time = self._last_target_time = now
+            self._duration = 0.0
+        self._send(x, y)
+
+    def reset(self):
+        """清除目标点（例如手离开画面后），下一个目标点将直接到达"""
+        with self._lock:
+            self._start_pos = None
+            self._target_pos = None
+
+    def _position_at(self, now: float) -> tuple[float, float]:
+        """计算指定时刻的插值位置（需持有 _lock）"""
+        tx, ty = self._target_pos
+        elapsed = now - self._start_time
+        if self._duration <= 0 or elapsed >= self._duration:
+            return tx, ty
+
+        sx, sy = self._start_pos
+        k = elapsed / self._duration
+        return sx + (tx - sx) * k, sy + (ty - sy) * k
+
+    def _send(self, x: int, y: int):
+        """输出一次移动（跳过与上次相同的位置）"""
+        with self._move_lock:
+            if (x, y) == self._last_sent:
+                return
+            try:
+                self._mouse.move_to(x, y)
+            except Exception:
+                logger.exception("Cursor move failed")
+            self._last_sent = (x, y)
+
+    def _run(self):
+        """输出循环"""
+        next_tick = time.perf_counter()
+        while self._running:
+            now = time.perf_counter()
+            with self._lock:
+                if self._target_pos is None:
+                    pos = None
+                    settled = True
+                else:
+                    pos = self._position_at(now)
+                    settled = now - self._start_time >= self._duration
+
+            if pos is not None:
+                self._send(int(round(pos[0])), int(round(pos[1])))
+
+            if settled:
+                # 已到达目标，等待新目标，不做空转
+                self._wakeup.wait()
+                self._wakeup.clear()
+                next_tick = time.perf_counter()
+                continue
+
+            next_tick += self._interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
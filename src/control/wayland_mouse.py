@@ -13,6 +13,8 @@ ydotool 是一个通用的输入模拟工具，支持 X11 和 Wayland。
     或者手动运行: sudo ydotoold
 """
 
+import functools
+import os
 import shutil
 import subprocess
 import time
@@ -317,15 +319,16 @@ class WaylandMouseController:
             self.mouse_up()
 
 
+@functools.lru_cache(maxsize=1)
 def is_wayland() -> bool:
     """
     检测是否在 Wayland 环境下运行
 
+    会话类型在进程生命周期内不会改变，结果只计算一次。
+
     Returns:
         是否是 Wayland 环境
     """
-    import os
-
     session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
     wayland_display = os.environ.get("WAYLAND_DISPLAY", "")
 
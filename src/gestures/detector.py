@@ -14,6 +14,15 @@ from ..tracker.hand_tracker import HandLandmarks, Point3D
 from .gestures import Gesture, GestureType
 
 
+# 四指的 (名称, MCP, PIP, TIP) 关键点索引
+_FINGER_JOINTS = (
+    ("index", 5, 6, 8),
+    ("middle", 9, 10, 12),
+    ("ring", 13, 14, 16),
+    ("pinky", 17, 18, 20),
+)
+
+
 class ClickState(Enum):
     """点击状态"""
 
@@ -284,68 +293,47 @@ class GestureDetector:
         使用手指尖与手掌中心的相对位置，以及手指弯曲角度综合判断
         """
         result = {}
-        wrist = hand.landmarks[0]  # 手腕
-
-        # 拇指 - 使用 x 坐标相对位置
-        thumb_tip = hand.get_finger_tip("thumb")
-        thumb_ip = hand.landmarks[3]  # 拇指 IP 关节
-        thumb_mcp = hand.get_finger_mcp("thumb")
-
-        # 计算拇指伸展程度
-        thumb_tip_to_ip = math.sqrt(
-            (thumb_tip.x - thumb_ip.x) ** 2 + (thumb_tip.y - thumb_ip.y) ** 2
-        )
-        thumb_mcp_to_ip = math.sqrt(
-            (thumb_mcp.x - thumb_ip.x) ** 2 + (thumb_mcp.y - thumb_ip.y) ** 2
-        )
+        landmarks = hand.landmarks
+        wrist = landmarks[HandLandmarks.WRIST]
+        wx, wy = wrist.x, wrist.y
 
-        # 根据手的类型调整判断
+        # 拇指 - 使用 x 坐标相对位置，根据手的类型调整判断
+        thumb_tip_x = landmarks[HandLandmarks.THUMB_TIP].x
+        thumb_ip_x = landmarks[HandLandmarks.THUMB_IP].x
         if hand.handedness == "Right":
-            result["thumb"] = thumb_tip.x < thumb_ip.x - 0.02
+            result["thumb"] = thumb_tip_x < thumb_ip_x - 0.02
         else:
-            result["thumb"] = thumb_tip.x > thumb_ip.x + 0.02
+            result["thumb"] = thumb_tip_x > thumb_ip_x + 0.02
 
         # 其他手指 - 使用更可靠的判断方法
-        finger_indices = {
-            "index": (5, 6, 7, 8),
-            "middle": (9, 10, 11, 12),
-            "ring": (13, 14, 15, 16),
-            "pinky": (17, 18, 19, 20),
-        }
-
-        for finger, (mcp_idx, pip_idx, dip_idx, tip_idx) in finger_indices.items():
-            mcp = hand.landmarks[mcp_idx]
-            pip = hand.landmarks[pip_idx]
-            dip = hand.landmarks[dip_idx]
-            tip = hand.landmarks[tip_idx]
+        for finger, mcp_idx, pip_idx, tip_idx in _FINGER_JOINTS:
+            mcp = landmarks[mcp_idx]
+            pip = landmarks[pip_idx]
+            tip = landmarks[tip_idx]
+            mx, my = mcp.x, mcp.y
+            px, py = pip.x, pip.y
+            tx, ty = tip.x, tip.y
 
             # 方法1: 指尖 y 坐标是否高于 PIP
-            tip_above_pip = tip.y < pip.y
+            tip_above_pip = ty < py
 
             # 方法2: 手指是否伸直（使用角度）
-            # 计算 MCP->PIP 和 PIP->TIP 的向量夹角
-            vec1 = (pip.x - mcp.x, pip.y - mcp.y)
-            vec2 = (tip.x - pip.x, tip.y - pip.y)
-
-            dot = vec1[0] * vec2[0] + vec1[1] * vec2[1]
-            mag1 = math.sqrt(vec1[0] ** 2 + vec1[1] ** 2)
-            mag2 = math.sqrt(vec2[0] ** 2 + vec2[1] ** 2)
-
-            if mag1 > 0 and mag2 > 0:
-                cos_angle = dot / (mag1 * mag2)
-                cos_angle = max(-1, min(1, cos_angle))  # 限制范围
-                is_straight = cos_angle > 0.5  # 夹角小于 60 度认为伸直
-            else:
-                is_straight = False
+            # 计算 MCP->PIP 和 PIP->TIP 的向量夹角，夹角小于 60 度认为伸直
+            v1x, v1y = px - mx, py - my
+            v2x, v2y = tx - px, ty - py
+            mag1 = math.hypot(v1x, v1y)
+            mag2 = math.hypot(v2x, v2y)
+            is_straight = (
+                mag1 > 0
+                and mag2 > 0
+                and (v1x * v2x + v1y * v2y) / (mag1 * mag2) > 0.5
+            )
 
             # 方法3: 指尖到手腕的距离 vs MCP 到手腕的距离
-            tip_to_wrist = math.sqrt((tip.x - wrist.x) ** 2 + (tip.y - wrist.y) ** 2)
-            mcp_to_wrist = math.sqrt((mcp.x - wrist.x) ** 2 + (mcp.y - wrist.y) ** 2)
-            tip_far = tip_to_wrist > mcp_to_wrist * 0.9
+            tip_far = math.hypot(tx - wx, ty - wy) > math.hypot(mx - wx, my - wy) * 0.9
 
             # 综合判断：至少满足两个条件
-            conditions_met = sum([tip_above_pip, is_straight, tip_far])
-            result[finger] = conditions_met >= 2
+            result[finger] = tip_above_pip + is_straight + tip_far >= 2
 
         return result
 
@@ -370,9 +358,7 @@ class GestureDetector:
         tip2 = hand.get_finger_tip(finger2)
 
         # 2D 距离（忽略 z，因为深度估计不准）
-        distance = math.sqrt((tip1.x - tip2.x) ** 2 + (tip1.y - tip2.y) ** 2)
-
-        return distance
+        return math.hypot(tip1.x - tip2.x, tip1.y - tip2.y)
 
     def _reset_click_state(self):
         """重置点击状态"""
@@ -4,16 +4,66 @@ LyraPointer 手势录制器
 录制和回放手势序列，用于宏录制和自动化操作。
 """
 
+import asyncio
+import bisect
+import functools
 import json
+import re
+import struct
 import threading
 import time
+from array import array
 from dataclasses import asdict, dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+# 可选：使用 orjson 加速录制文件的编解码
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from ..utils.logging import get_logger
 from .gestures import Gesture, GestureType
 
+logger = get_logger(__name__)
+
+# 默认不录制的空闲手势
+_IDLE_GESTURE_TYPES = frozenset({GestureType.NONE, GestureType.FIST})
+
+# 帧数超过此值时 get_frame_at 改用插值查找
+# （实测约 100 万帧以下 C 实现的 bisect 更快）
+_INTERPOLATION_SEARCH_MIN_FRAMES = 1 << 20
+# 插值查找失败时回退到二分查找前的最大探测次数
+_INTERPOLATION_MAX_PROBES = 3
+
+# 读取录制文件头时每次读取的字符数
+_HEADER_CHUNK_SIZE = 4096
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# 二进制录制格式：
+#   文件头 (magic, version, frame_count, header_len) + JSON 头部信息
+#   + frame_count 条定长帧记录 + 变长附加数据区
+_BINARY_MAGIC = b"LYRP"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sHII")
+# timestamp, 手势类型索引, 标志位, x, y, 屏幕 x, 屏幕 y, 附加数据长度
+_BINARY_FRAME = struct.Struct("<dHBddiiI")
+_HAS_POSITION = 0x01
+_HAS_SCREEN_POSITION = 0x02
+
+
+def _dumps(obj: Any) -> bytes:
+    """编码为 UTF-8 JSON 字节串"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 class RecordingState(Enum):
     """录制状态"""
@@ -24,7 +74,16 @@ class RecordingState(Enum):
     PLAYING = auto()  # 回放中
 
 
-@dataclass
+def _as_tuple(value: Optional[Sequence]) -> Optional[tuple]:
+    """将坐标转换为元组，已经是元组时直接返回"""
+    if not value:
+        return None
+    if isinstance(value, tuple):
+        return value
+    return tuple(value)
+
+
+@dataclass(slots=True)
 class GestureFrame:
     """手势帧数据"""
 
@@ -32,7 +91,7 @@ class GestureFrame:
     gesture_type: str  # 手势类型名称
     position: Optional[Tuple[float, float]] = None  # 归一化坐标 (0-1)
     screen_position: Optional[Tuple[int, int]] = None  # 屏幕像素坐标
-    data: Dict[str, Any] = field(default_factory=dict)  # 附加数据
+    data: Optional[Dict[str, Any]] = None  # 附加数据（大多数帧为空，按需分配）
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -41,7 +100,7 @@ class GestureFrame:
             "gesture_type": self.gesture_type,
             "position": self.position,
             "screen_position": self.screen_position,
-            "data": self.data,
+            "data": self.data if self.data is not None else {},
         }
 
     @classmethod
@@ -50,15 +109,13 @@ class GestureFrame:
         return cls(
             timestamp=data["timestamp"],
             gesture_type=data["gesture_type"],
-            position=tuple(data["position"]) if data.get("position") else None,
-            screen_position=(
-                tuple(data["screen_position"]) if data.get("screen_position") else None
-            ),
-            data=data.get("data", {}),
+            position=_as_tuple(data.get("position")),
+            screen_position=_as_tuple(data.get("screen_position")),
+            data=data.get("data") or None,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureRecording:
     """手势录制数据"""
 
@@ -68,18 +125,31 @@ class GestureRecording:
     duration: float = 0.0
     frames: List[GestureFrame] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # 与 frames 平行的时间戳索引，供 get_frame_at 二分查找
+    _timestamps: array = field(
+        default_factory=lambda: array("d"), init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
+    def __post_init__(self):
+        self._timestamps = array("d", [f.timestamp for f in self.frames])
+
+    def _header_dict(self) -> Dict[str, Any]:
+        """除帧数据外的顶层字段"""
         return {
             "name": self.name,
             "description": self.description,
             "created_at": self.created_at,
             "duration": self.duration,
-            "frames": [f.to_dict() for f in self.frames],
+            "frame_count": len(self.frames),
             "metadata": self.metadata,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        data = self._header_dict()
+        data["frames"] = [f.to_dict() for f in self.frames]
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GestureRecording":
         """从字典创建"""
@@ -102,8 +172,19 @@ class GestureRecording:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        # 逐帧流式写入，避免一次性构建整个字典列表
+        with open(path, "wb") as f:
+            f.write(b"{\n")
+            for key, value in self._header_dict().items():
+                f.write(b"  %s: %s,\n" % (_dumps(key), _dumps(value)))
+
+            f.write(b'  "frames": [')
+            separator = b"\n    "
+            for frame in self.frames:
+                f.write(separator)
+                f.write(_dumps(frame.to_dict()))
+                separator = b",\n    "
+            f.write(b"\n  ]\n}\n")
 
     @classmethod
     def load(cls, path: Path) -> "GestureRecording":
@@ -116,15 +197,194 @@ class GestureRecording:
         Returns:
             录制数据
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if HAS_ORJSON:
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         return cls.from_dict(data)
 
+    @classmethod
+    def load_header(cls, path: Path) -> Dict[str, Any]:
+        """
+        只读取录制文件的头部信息（不解析帧数据）
+
+        save() 将顶层字段写在 "frames" 之前，因此读到 "frames" 即可停止。
+        旧格式文件缺少 frame_count 时回退到完整加载。
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            包含 name/description/created_at/duration/frame_count 的字典
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            header = _HeaderReader(f).read()
+
+        if "frame_count" not in header:
+            recording = cls.load(path)
+            header = recording._header_dict()
+
+        return {
+            "name": header.get("name", "Untitled"),
+            "description": header.get("description", ""),
+            "created_at": header.get("created_at", 0.0),
+            "duration": header.get("duration", 0.0),
+            "frame_count": header["frame_count"],
+        }
+
+    def save_binary(self, path: Path):
+        """
+        以紧凑的二进制格式保存录制
+
+        帧数据使用定长 struct 记录，适合大型录制的快速读写。
+
+        Args:
+            path: 文件路径
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        header = self._header_dict()
+        del header["frame_count"]
+        type_indices: Dict[str, int] = {}
+        frame_buf = bytearray(_BINARY_FRAME.size * len(self.frames))
+        data_chunks: List[bytes] = []
+
+        offset = 0
+        for frame in self.frames:
+            type_index = type_indices.setdefault(frame.gesture_type, len(type_indices))
+            flags = 0
+            x = y = 0.0
+            sx = sy = 0
+            if frame.position:
+                flags |= _HAS_POSITION
+                x, y = frame.position
+            if frame.screen_position:
+                flags |= _HAS_SCREEN_POSITION
+                sx, sy = frame.screen_position
+            data = _dumps(frame.data) if frame.data else b""
+            if data:
+                data_chunks.append(data)
+
+            _BINARY_FRAME.pack_into(
+                frame_buf,
+                offset,
+                frame.timestamp,
+                type_index,
+                flags,
+                x,
+                y,
+                int(sx),
+                int(sy),
+                len(data),
+            )
+            offset += _BINARY_FRAME.size
+
+        header["gesture_types"] = list(type_indices)
+        header_bytes = _dumps(header)
+
+        with open(path, "wb") as f:
+            f.write(
+                _BINARY_HEADER.pack(
+                    _BINARY_MAGIC, _BINARY_VERSION, len(self.frames), len(header_bytes)
+                )
+            )
+            f.write(header_bytes)
+            f.write(frame_buf)
+            f.writelines(data_chunks)
+
+    @classmethod
+    def load_binary(cls, path: Path) -> "GestureRecording":
+        """
+        从二进制格式文件加载录制
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            录制数据
+
+        Raises:
+            ValueError: 文件不是受支持的二进制录制格式
+        """
+        raw = Path(path).read_bytes()
+        magic, version, frame_count, header_len = _BINARY_HEADER.unpack_from(raw)
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"Not a LyraPointer binary recording: {path}")
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported binary recording version: {version}")
+
+        offset = _BINARY_HEADER.size
+        header = json.loads(raw[offset : offset + header_len])
+        offset += header_len
+        frames_end = offset + frame_count * _BINARY_FRAME.size
+
+        gesture_types = header.get("gesture_types", [])
+        data_offset = frames_end
+        frames = []
+        records = _BINARY_FRAME.iter_unpack(memoryview(raw)[offset:frames_end])
+        for timestamp, type_index, flags, x, y, sx, sy, data_len in records:
+            data = None
+            if data_len:
+                data = json.loads(raw[data_offset : data_offset + data_len])
+                data_offset += data_len
+            frames.append(
+                GestureFrame(
+                    timestamp=timestamp,
+                    gesture_type=gesture_types[type_index],
+                    position=(x, y) if flags & _HAS_POSITION else None,
+                    screen_position=(sx, sy) if flags & _HAS_SCREEN_POSITION else None,
+                    data=data,
+                )
+            )
+
+        return cls(
+            name=header.get("name", "Untitled"),
+            description=header.get("description", ""),
+            created_at=header.get("created_at", time.time()),
+            duration=header.get("duration", 0.0),
+            frames=frames,
+            metadata=header.get("metadata", {}),
+        )
+
     @property
     def frame_count(self) -> int:
         """帧数"""
         return len(self.frames)
 
+    def add_frame(self, frame: GestureFrame):
+        """
+        追加一帧并同步时间戳索引
+
+        Args:
+            frame: 手势帧（时间戳需不小于最后一帧）
+        """
+        self.frames.append(frame)
+        self._timestamps.append(frame.timestamp)
+
+    def extend_frames(self, frames: List[GestureFrame]):
+        """
+        批量追加帧并同步时间戳索引
+
+        Args:
+            frames: 按时间排序的手势帧列表
+        """
+        self.frames.extend(frames)
+        self._timestamps.extend([f.timestamp for f in frames])
+
+    def _ensure_timestamps(self) -> array:
+        """获取时间戳索引，frames 被直接修改过时重建"""
+        if len(self._timestamps) != len(self.frames):
+            self._timestamps = array("d", [f.timestamp for f in self.frames])
+        return self._timestamps
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """所有帧的时间戳（float64 数组副本）"""
+        # 复制而不是 frombuffer 共享内存：导出缓冲区的 array 无法再 append
+        return np.array(self._ensure_timestamps(), dtype=np.float64)
+
     def get_frame_at(self, time_offset: float) -> Optional[GestureFrame]:
         """
         获取指定时间的帧
@@ -135,19 +395,131 @@ class GestureRecording:
         Returns:
             手势帧，如果没有则返回 None
         """
-        if not self.frames:
-            return None
+        # 查找最后一个 timestamp <= time_offset 的帧
+        timestamps = self._ensure_timestamps()
+        if len(timestamps) >= _INTERPOLATION_SEARCH_MIN_FRAMES:
+            index = _interpolation_search(timestamps, time_offset)
+        else:
+            index = bisect.bisect_right(timestamps, time_offset) - 1
+        return self.frames[index] if index >= 0 else None
 
-        # 二分查找
-        left, right = 0, len(self.frames) - 1
-        while left < right:
-            mid = (left + right + 1) // 2
-            if self.frames[mid].timestamp <= time_offset:
-                left = mid
-            else:
-                right = mid - 1
+    def get_frames_at(self, time_offsets) -> List[Optional[GestureFrame]]:
+        """
+        批量获取多个时间点的帧
 
-        return self.frames[left] if self.frames[left].timestamp <= time_offset else None
+        Args:
+            time_offsets: 时间偏移序列（秒）
+
+        Returns:
+            与 time_offsets 一一对应的手势帧列表，没有则为 None
+        """
+        indices = np.searchsorted(self.timestamps, time_offsets, side="right") - 1
+        frames = self.frames
+        return [frames[i] if i >= 0 else None for i in indices.tolist()]
+
+
+def _interpolation_search(timestamps: Sequence[float], time_offset: float) -> int:
+    """
+    插值查找最后一个不大于 time_offset 的索引
+
+    录制帧间隔近似均匀，通常一次探测即可命中；
+    探测若干次仍未命中时在缩小后的区间内回退到二分查找。
+
+    Returns:
+        索引，没有则为 -1
+    """
+    lo, hi = 0, len(timestamps) - 1
+    if hi < 0 or time_offset < timestamps[0]:
+        return -1
+    if time_offset >= timestamps[hi]:
+        return hi
+
+    # 循环不变式：timestamps[lo] <= time_offset < timestamps[hi]
+    for _ in range(_INTERPOLATION_MAX_PROBES):
+        t_lo = timestamps[lo]
+        span = timestamps[hi] - t_lo
+        mid = min(lo + int((time_offset - t_lo) * (hi - lo) / span), hi - 1)
+        if timestamps[mid] <= time_offset:
+            if timestamps[mid + 1] > time_offset:
+                return mid
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return bisect.bisect_right(timestamps, time_offset, lo, hi) - 1
+
+
+class _HeaderReader:
+    """增量解析 JSON 顶层对象的字段，遇到 "frames" 时停止"""
+
+    def __init__(self, file):
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+
+    def read(self) -> Dict[str, Any]:
+        """读取 "frames" 之前的所有顶层字段"""
+        header: Dict[str, Any] = {}
+        self._expect("{")
+        if self._peek() == "}":
+            return header
+
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "frames":
+                break
+            header[key] = self._value()
+            if self._expect(",}") == "}":
+                break
+
+        return header
+
+    def _fill(self) -> bool:
+        """读取下一块数据，文件结束时返回 False"""
+        chunk = self._file.read(_HEADER_CHUNK_SIZE)
+        if not chunk:
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """跳过空白并返回下一个字符"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of recording file")
+
+    def _expect(self, chars: str) -> str:
+        """读取一个结构字符"""
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Unexpected {char!r} in recording header")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """解析下一个 JSON 值，缓冲区不足时继续读取"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 缓冲区末尾的数字可能被截断（如 "12" + "3.4"），
+            # 确认值后面紧跟的是字段分隔符
+            next_pos = _WHITESPACE.match(self._buf, end).end()
+            if next_pos == len(self._buf) or self._buf[next_pos] not in ",:}":
+                if self._fill():
+                    continue
+            self._pos = end
+            return value
 
 
 # 回调类型
@@ -156,6 +528,14 @@ OnPlaybackCallback = Callable[[GestureFrame, float], None]  # (frame, progress)
 OnStateChangeCallback = Callable[[RecordingState], None]
 
 
+def _check_callback(callback: Optional[Callable], optional: bool = False):
+    """注册时校验回调，避免在热路径中才发现错误"""
+    if callback is None and optional:
+        return
+    if not callable(callback):
+        raise TypeError(f"Callback must be callable, got {type(callback).__name__}")
+
+
 class GestureRecorder:
     """
     手势录制器
@@ -176,24 +556,36 @@ class GestureRecorder:
 
     def __init__(self):
         self._state = RecordingState.IDLE
+        self._state_lock = threading.Lock()
+        # 重新开始录制/回放时抑制中间的 IDLE 通知，只通知最终状态
+        self._suppress_state_events = False
         self._recording: Optional[GestureRecording] = None
-        self._start_time: float = 0.0
-        self._pause_time: float = 0.0
-        self._total_pause_duration: float = 0.0
+        # 录制计时使用 time.monotonic_ns()，整数纳秒避免长时间录制的精度漂移
+        self._start_ns: int = 0
+        self._pause_ns: int = 0
+        self._total_pause_ns: int = 0
 
         # 回放相关
         self._playback_thread: Optional[threading.Thread] = None
         self._playback_stop_event = threading.Event()
         self._playback_speed: float = 1.0
+        # 回放会话编号：每次开始/停止回放加一，旧会话据此发现自己已失效
+        self._playback_session: int = 0
+        # 当前异步回放的 (事件循环, 停止事件)，供 stop_playback() 唤醒
+        self._async_stop: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = (
+            None
+        )
 
-        # 回调
-        self._on_record_callbacks: List[OnRecordCallback] = []
-        self._on_playback_callbacks: List[OnPlaybackCallback] = []
-        self._on_state_change_callbacks: List[OnStateChangeCallback] = []
+        # 回调（不可变元组，注册时整体替换，分发时无需加锁）
+        self._on_record_callbacks: Tuple[OnRecordCallback, ...] = ()
+        self._on_playback_callbacks: Tuple[OnPlaybackCallback, ...] = ()
+        self._on_state_change_callbacks: Tuple[OnStateChangeCallback, ...] = ()
 
         # 过滤设置
-        self._min_frame_interval: float = 0.016  # 最小帧间隔（约60fps）
-        self._last_frame_time: float = 0.0
+        self._min_frame_interval_ns: int = 16_000_000  # 最小帧间隔（约60fps）
+        self._last_frame_ns: int = 0
+        # 暂存的帧数据 (timestamp, gesture_type, position, screen_position, data)
+        self._pending_frames: List[tuple] = []
         self._record_idle: bool = False  # 是否录制空闲手势
 
     @property
@@ -214,6 +606,7 @@ class GestureRecorder:
     @property
     def current_recording(self) -> Optional[GestureRecording]:
         """获取当前录制"""
+        self._flush_pending_frames()
         return self._recording
 
     @property
@@ -222,19 +615,49 @@ class GestureRecorder:
         if self._state == RecordingState.IDLE:
             return 0.0
         elif self._state == RecordingState.PAUSED:
-            return self._pause_time - self._start_time - self._total_pause_duration
+            now = self._pause_ns
         else:
-            return time.time() - self._start_time - self._total_pause_duration
+            now = time.monotonic_ns()
+        return (now - self._start_ns - self._total_pause_ns) / 1e9
+
+    def _set_state(
+        self, state: RecordingState, expected: Optional[RecordingState] = None
+    ) -> bool:
+        """
+        设置状态并触发回调
+
+        Args:
+            state: 新状态
+            expected: 如果提供，只有当前状态等于该值时才切换
 
-    def _set_state(self, state: RecordingState):
-        """设置状态并触发回调"""
-        if self._state != state:
+        Returns:
+            状态是否发生了变化
+        """
+        # 比较并切换在锁内完成，保证回放线程与调用线程同时结束回放时
+        # 状态回调只触发一次
+        with self._state_lock:
+            if self._state == state or (
+                expected is not None and self._state != expected
+            ):
+                return False
             self._state = state
-            for callback in self._on_state_change_callbacks:
-                try:
-                    callback(state)
-                except Exception:
-                    pass
+
+        if not self._suppress_state_events:
+            self._dispatch(self._on_state_change_callbacks, state)
+        return True
+
+    @staticmethod
+    def _dispatch(callbacks: Tuple[Callable, ...], *args):
+        """依次调用回调，出错时记录日志并继续调用其余回调（不向调用方抛出）"""
+        # 只在出错时重新进入 try，从出错回调的下一个继续
+        remaining = iter(callbacks)
+        while True:
+            try:
+                for callback in remaining:
+                    callback(*args)
+                return
+            except Exception:
+                logger.exception("Error in recorder callback")
 
     def start_recording(
         self,
@@ -251,17 +674,22 @@ class GestureRecorder:
             metadata: 附加元数据
         """
         if self._state != RecordingState.IDLE:
-            self.stop_recording()
+            self._suppress_state_events = True
+            try:
+                self.stop_recording()
+            finally:
+                self._suppress_state_events = False
 
         self._recording = GestureRecording(
             name=name,
             description=description,
             metadata=metadata or {},
         )
-        self._start_time = time.time()
-        self._pause_time = 0.0
-        self._total_pause_duration = 0.0
-        self._last_frame_time = 0.0
+        self._start_ns = time.monotonic_ns()
+        self._pause_ns = 0
+        self._total_pause_ns = 0
+        self._last_frame_ns = 0
+        self._pending_frames.clear()
 
         self._set_state(RecordingState.RECORDING)
 
@@ -275,6 +703,7 @@ class GestureRecorder:
         if self._state == RecordingState.IDLE:
             return None
 
+        self._flush_pending_frames()
         recording = self._recording
         if recording:
             recording.duration = self.elapsed_time
@@ -287,13 +716,13 @@ class GestureRecorder:
     def pause_recording(self):
         """暂停录制"""
         if self._state == RecordingState.RECORDING:
-            self._pause_time = time.time()
+            self._pause_ns = time.monotonic_ns()
             self._set_state(RecordingState.PAUSED)
 
     def resume_recording(self):
         """恢复录制"""
         if self._state == RecordingState.PAUSED:
-            self._total_pause_duration += time.time() - self._pause_time
+            self._total_pause_ns += time.monotonic_ns() - self._pause_ns
             self._set_state(RecordingState.RECORDING)
 
     def record_frame(
@@ -319,42 +748,44 @@ class GestureRecorder:
             return False
 
         # 过滤空闲手势
-        if not self._record_idle and gesture.type in (
-            GestureType.NONE,
-            GestureType.FIST,
-        ):
+        if not self._record_idle and gesture.type in _IDLE_GESTURE_TYPES:
             return False
 
-        # 帧率限制
-        current_time = time.time()
-        if current_time - self._last_frame_time < self._min_frame_interval:
+        # 帧率限制（只读取一次时钟，同时用于计算时间戳）
+        now = time.monotonic_ns()
+        if now - self._last_frame_ns < self._min_frame_interval_ns:
             return False
-        self._last_frame_time = current_time
-
-        # 计算相对时间戳
-        timestamp = self.elapsed_time
-
-        # 创建帧
-        frame = GestureFrame(
-            timestamp=timestamp,
-            gesture_type=gesture.type.name,
-            position=position,
-            screen_position=screen_position,
-            data=data or {},
+        self._last_frame_ns = now
+
+        record = (
+            (now - self._start_ns - self._total_pause_ns) / 1e9,
+            gesture.type.name,
+            position,
+            screen_position,
+            data or None,
         )
 
-        # 添加到录制
-        self._recording.frames.append(frame)
+        # 没有回调时只暂存原始元组，GestureFrame 延迟到读取录制时批量创建
+        if not self._on_record_callbacks:
+            self._pending_frames.append(record)
+            return True
+
+        self._flush_pending_frames()
+        frame = GestureFrame(*record)
+        self._recording.add_frame(frame)
 
         # 触发回调
-        for callback in self._on_record_callbacks:
-            try:
-                callback(frame)
-            except Exception:
-                pass
+        self._dispatch(self._on_record_callbacks, frame)
 
         return True
 
+    def _flush_pending_frames(self):
+        """将暂存的帧批量转换为 GestureFrame 并写入当前录制"""
+        # 先换出列表再转换，追踪线程同时追加的帧会进入新列表而不会被清除
+        pending, self._pending_frames = self._pending_frames, []
+        if pending and self._recording is not None:
+            self._recording.extend_frames([GestureFrame(*record) for record in pending])
+
     def play(
         self,
         recording: GestureRecording,
@@ -372,77 +803,195 @@ class GestureRecorder:
             on_frame: 帧回调
             on_complete: 完成回调
             loop: 是否循环播放
+
+        Raises:
+            TypeError: on_frame 或 on_complete 不可调用
         """
-        if self._state == RecordingState.PLAYING:
-            self.stop_playback()
+        _check_callback(on_frame, optional=True)
+        _check_callback(on_complete, optional=True)
 
-        self._playback_speed = max(0.1, min(10.0, speed))
-        self._playback_stop_event.clear()
+        schedule, session = self._prepare_playback(recording, speed)
+        frame_callbacks = (on_frame,) if on_frame else ()
+        # 每次回放使用独立的停止事件，新回放不会清除旧回放的停止信号
+        stop_event = self._playback_stop_event
 
         def playback_loop():
             self._set_state(RecordingState.PLAYING)
 
-            while not self._playback_stop_event.is_set():
-                start_time = time.time()
+            for wait_time, frame, progress in self._iter_schedule(
+                schedule, loop, time.monotonic
+            ):
+                # 等待到帧的截止时间，收到停止信号时立即返回
+                if wait_time > 0:
+                    stop_event.wait(wait_time)
+
+                # 旧线程可能仍停留在慢回调中，被取代后立即退出
+                if not self._emit_playback_frame(
+                    session, frame_callbacks, frame, progress
+                ):
+                    return
+
+            self._finish_playback(session, on_complete)
+
+        self._playback_thread = threading.Thread(target=playback_loop, daemon=True)
+        self._playback_thread.start()
+
+    async def play_async(
+        self,
+        recording: GestureRecording,
+        speed: float = 1.0,
+        on_frame: Optional[OnPlaybackCallback] = None,
+        on_complete: Optional[Callable[[], None]] = None,
+        loop: bool = False,
+    ):
+        """
+        在当前 asyncio 事件循环中播放录制（不创建回放线程）
+
+        取消任务或调用 stop_playback() 即可停止回放。
 
-                for i, frame in enumerate(recording.frames):
-                    if self._playback_stop_event.is_set():
-                        break
+        Args:
+            recording: 要播放的录制
+            speed: 播放速度（1.0 = 正常速度）
+            on_frame: 帧回调
+            on_complete: 完成回调（回放被停止或取消时不调用）
+            loop: 是否循环播放
 
-                    # 计算等待时间
-                    target_time = frame.timestamp / self._playback_speed
-                    elapsed = time.time() - start_time
-                    wait_time = target_time - elapsed
+        Raises:
+            TypeError: on_frame 或 on_complete 不可调用
+        """
+        _check_callback(on_frame, optional=True)
+        _check_callback(on_complete, optional=True)
 
-                    if wait_time > 0:
-                        # 使用小间隔检查停止事件
-                        while wait_time > 0 and not self._playback_stop_event.is_set():
-                            sleep_time = min(wait_time, 0.01)
-                            time.sleep(sleep_time)
-                            wait_time -= sleep_time
+        schedule, session = self._prepare_playback(recording, speed)
+        frame_callbacks = (on_frame,) if on_frame else ()
+        event_loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        self._async_stop = (event_loop, stop)
 
-                    if self._playback_stop_event.is_set():
-                        break
+        self._set_state(RecordingState.PLAYING)
+        try:
+            for wait_time, frame, progress in self._iter_schedule(
+                schedule, loop, event_loop.time
+            ):
+                if wait_time > 0:
+                    # 等待到帧的截止时间，stop_playback() 会立即唤醒
+                    try:
+                        await asyncio.wait_for(stop.wait(), wait_time)
+                    except asyncio.TimeoutError:
+                        pass
+
+                if not self._emit_playback_frame(
+                    session, frame_callbacks, frame, progress
+                ):
+                    return
+        except BaseException:
+            # 任务被取消：只恢复状态，不触发完成回调
+            if self._playback_session == session:
+                self._set_state(RecordingState.IDLE, expected=RecordingState.PLAYING)
+            raise
+        finally:
+            if self._async_stop is not None and self._async_stop[1] is stop:
+                self._async_stop = None
+
+        self._finish_playback(session, on_complete)
+
+    @staticmethod
+    def _iter_schedule(
+        schedule: List[Tuple[GestureFrame, float, float]],
+        loop: bool,
+        clock: Callable[[], float],
+    ) -> Iterator[Tuple[float, GestureFrame, float]]:
+        """
+        按回放时间表依次产出帧
 
-                    # 计算进度
-                    progress = (i + 1) / len(recording.frames)
+        Args:
+            schedule: [(帧, 截止时间, 进度), ...]
+            loop: 是否循环播放
+            clock: 单调时钟（秒）
 
-                    # 触发回调
-                    if on_frame:
-                        try:
-                            on_frame(frame, progress)
-                        except Exception:
-                            pass
+        Yields:
+            (距截止时间的等待秒数, 帧, 进度)；等待时间在取下一帧时才计算
+        """
+        while True:
+            start_time = clock()
+            for frame, target_time, progress in schedule:
+                yield target_time - (clock() - start_time), frame, progress
+            if not loop or not schedule:
+                return
+
+    def _emit_playback_frame(
+        self,
+        session: int,
+        frame_callbacks: Tuple[Callable, ...],
+        frame: GestureFrame,
+        progress: float,
+    ) -> bool:
+        """
+        分发一帧回放
 
-                    for callback in self._on_playback_callbacks:
-                        try:
-                            callback(frame, progress)
-                        except Exception:
-                            pass
+        Returns:
+            回放是否仍在进行（已停止或被新的回放取代时返回 False，不再分发）
+        """
+        if self._playback_session != session:
+            return False
+        self._dispatch(frame_callbacks, frame, progress)
+        self._dispatch(self._on_playback_callbacks, frame, progress)
+        return True
 
-                if not loop:
-                    break
+    def _finish_playback(self, session: int, on_complete: Optional[Callable[[], None]]):
+        """回放自然结束：恢复空闲状态并触发完成回调（会话已失效时不做任何事）"""
+        if self._playback_session != session:
+            return
+        self._set_state(RecordingState.IDLE, expected=RecordingState.PLAYING)
+        if on_complete:
+            self._dispatch((on_complete,))
+
+    def _prepare_playback(
+        self, recording: GestureRecording, speed: float
+    ) -> Tuple[List[Tuple[GestureFrame, float, float]], int]:
+        """
+        停止正在进行的回放并预先计算回放时间表
 
-            self._set_state(RecordingState.IDLE)
+        Returns:
+            ([(帧, 截止时间, 进度), ...], 新回放会话编号)
+        """
+        if self._state == RecordingState.PLAYING:
+            self._suppress_state_events = True
+            try:
+                self.stop_playback()
+            finally:
+                self._suppress_state_events = False
 
-            if on_complete and not self._playback_stop_event.is_set():
-                try:
-                    on_complete()
-                except Exception:
-                    pass
+        self._playback_speed = max(0.1, min(10.0, speed))
+        self._playback_stop_event = threading.Event()
 
-        self._playback_thread = threading.Thread(target=playback_loop, daemon=True)
-        self._playback_thread.start()
+        frames = list(recording.frames)
+        frame_count = len(frames)
+        deadlines = (recording.timestamps / self._playback_speed).tolist()
+        progresses = (np.arange(1, frame_count + 1) / max(frame_count, 1)).tolist()
+        self._playback_session += 1
+        return list(zip(frames, deadlines, progresses)), self._playback_session
 
     def stop_playback(self):
         """停止回放"""
+        self._playback_session += 1
         self._playback_stop_event.set()
 
+        # 唤醒正在等待的异步回放（可能在其他线程的事件循环中）
+        if self._async_stop is not None:
+            event_loop, stop = self._async_stop
+            self._async_stop = None
+            try:
+                event_loop.call_soon_threadsafe(stop.set)
+            except RuntimeError:
+                # 事件循环已关闭
+                pass
+
         if self._playback_thread and self._playback_thread.is_alive():
             self._playback_thread.join(timeout=1.0)
 
         self._playback_thread = None
-        self._set_state(RecordingState.IDLE)
+        self._set_state(RecordingState.IDLE, expected=RecordingState.PLAYING)
 
     def on_record(self, callback: OnRecordCallback):
         """
@@ -450,8 +999,12 @@ class GestureRecorder:
 
         Args:
             callback: 回调函数
+
+        Raises:
+            TypeError: callback 不可调用
         """
-        self._on_record_callbacks.append(callback)
+        _check_callback(callback)
+        self._on_record_callbacks += (callback,)
 
     def on_playback(self, callback: OnPlaybackCallback):
         """
@@ -459,8 +1012,12 @@ class GestureRecorder:
 
         Args:
             callback: 回调函数
+
+        Raises:
+            TypeError: callback 不可调用
         """
-        self._on_playback_callbacks.append(callback)
+        _check_callback(callback)
+        self._on_playback_callbacks += (callback,)
 
     def on_state_change(self, callback: OnStateChangeCallback):
         """
@@ -468,8 +1025,12 @@ class GestureRecorder:
 
         Args:
             callback: 回调函数
+
+        Raises:
+            TypeError: callback 不可调用
         """
-        self._on_state_change_callbacks.append(callback)
+        _check_callback(callback)
+        self._on_state_change_callbacks += (callback,)
 
     def set_min_frame_interval(self, interval: float):
         """
@@ -478,7 +1039,7 @@ class GestureRecorder:
         Args:
             interval: 间隔时间（秒）
         """
-        self._min_frame_interval = max(0.001, interval)
+        self._min_frame_interval_ns = int(max(0.001, interval) * 1e9)
 
     def set_record_idle(self, record: bool):
         """
@@ -491,9 +1052,9 @@ class GestureRecorder:
 
     def clear_callbacks(self):
         """清除所有回调"""
-        self._on_record_callbacks.clear()
-        self._on_playback_callbacks.clear()
-        self._on_state_change_callbacks.clear()
+        self._on_record_callbacks = ()
+        self._on_playback_callbacks = ()
+        self._on_state_change_callbacks = ()
 
 
 class RecordingManager:
@@ -567,19 +1128,18 @@ class RecordingManager:
         path = self._recordings_dir / filename
         return GestureRecording.load(path)
 
-    def list_recordings(self) -> List[Tuple[str, GestureRecording]]:
+    def list_recordings(self) -> List[Tuple[str, Dict[str, Any]]]:
         """
-        列出所有录制
+        列出所有录制（只读取文件头，不解析帧数据）
 
         Returns:
-            [(文件名, 录制数据), ...]
+            [(文件名, 录制信息), ...]，录制信息格式同 get_recording_info
         """
         recordings = []
 
         for path in sorted(self._recordings_dir.glob("*.json")):
             try:
-                recording = GestureRecording.load(path)
-                recordings.append((path.name, recording))
+                recordings.append((path.name, _cached_header(path)))
             except Exception:
                 pass
 
@@ -616,19 +1176,27 @@ class RecordingManager:
         Returns:
             录制信息
         """
+        if not filename.endswith(".json"):
+            filename += ".json"
+
         try:
-            recording = self.load_recording(filename)
-            return {
-                "name": recording.name,
-                "description": recording.description,
-                "created_at": recording.created_at,
-                "duration": recording.duration,
-                "frame_count": recording.frame_count,
-            }
+            return _cached_header(self._recordings_dir / filename)
         except Exception:
             return None
 
 
+@functools.lru_cache(maxsize=256)
+def _load_header_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """按 (路径, 修改时间, 大小) 缓存文件头，文件变化后自动失效"""
+    return GestureRecording.load_header(Path(path))
+
+
+def _cached_header(path: Path) -> Dict[str, Any]:
+    """读取录制文件头（带缓存），返回副本以免调用方修改缓存"""
+    stat = path.stat()
+    return dict(_load_header_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
 # 全局录制器实例
 _global_recorder: Optional[GestureRecorder] = None
 
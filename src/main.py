@@ -6,19 +6,23 @@ LyraPointer 主程序
 """
 
 import argparse
-import os
+import functools
+import statistics
 import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional
 
 import cv2
 
 from .config import Settings
 from .control import MouseController, ScreenManager
+from .control.cursor_mover import CursorMover
 from .control.wayland_mouse import WaylandMouseController, is_wayland
 from .gestures import Gesture, GestureDetector, GestureType
-from .tracker import HandTracker, Smoother
-from .ui import SettingsWindow, SystemTray, Visualizer
+from .tracker import CaptureThread, HandTracker, Smoother
+from .ui import Visualizer
 from .utils.i18n import Language, get_i18n, t
 
 
@@ -35,8 +39,13 @@ class LyraPointer:
         # 加载配置
         self.settings = Settings(config_path)
 
+        # 限制 OpenCV 线程数，避免与 MediaPipe 的推理线程争抢 CPU
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(self.settings.cv_threads)
+
         # 初始化多语言
         self._init_i18n()
+        self._load_strings()
 
         # 初始化组件
         self._init_components()
@@ -45,11 +54,11 @@ class LyraPointer:
         self._is_running = False
         self._is_paused = False
         self._show_window = True
+        self._use_tray = True  # 无界面模式下不创建系统托盘
         self._last_gesture: Optional[Gesture] = None
         self._is_dragging = False
 
-        # 性能优化：帧跳过计数
-        self._frame_count = 0
+        # 性能优化：帧跳过间隔（由采集线程执行，被跳过的帧不解码）
         self._process_interval = self.settings.get(
             "settings.performance.process_interval", 1
         )
@@ -58,6 +67,50 @@ class LyraPointer:
         self._last_process_time = 0.0
         self._min_process_interval = 0.016  # ~60fps 上限
 
+        # 性能优化：按每帧处理耗时的指数滑动平均自适应调整解码间隔，
+        # 处理跟不上摄像头时，反正会被丢弃的帧不再解码
+        self._loop_time_ewma = 0.0
+        self._loop_time_alpha = 0.1
+        self._frame_period = 1.0 / max(1, self.settings.camera_fps)
+
+        # 性能优化：送入 MediaPipe 的图像最大宽度
+        self._tracking_width = self.settings.tracking_width
+        self._track_buf = None  # 复用的缩小图像缓冲区
+
+        # 性能优化：长时间无手时降低手掌检测频率
+        self._no_hand_frames = 0
+        self._idle_after_frames = 30  # 连续多少帧无手后进入空闲检测
+        self._idle_detect_interval = 3  # 空闲时每隔几帧检测一次
+
+        # 性能优化：推理持续过慢时自动降级到 Lite 模型
+        self._inference_times: deque[float] = deque(maxlen=30)
+        self._max_inference_time = 0.025  # 中位数超过 25ms 即降级
+
+        # 性能优化：推理与界面渲染流水线并行（窗口显示时，增加一帧延迟）
+        self._pipeline_inference = self.settings.pipeline_inference
+        self._inference_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_job: Optional[tuple] = None  # (frame, Future)
+
+        # 性能优化：控制区域矩形缓存 ((w, h), rect)，设置变更时失效
+        self._zone_rect_cache: Optional[tuple] = None
+
+        # 手势 -> 处理方法
+        self._gesture_actions = {
+            GestureType.POINTER: self._on_pointer_gesture,
+            GestureType.CLICK: self._on_click_gesture,
+            GestureType.DOUBLE_CLICK: self._on_double_click_gesture,
+            GestureType.CLICK_HOLD: self._on_drag_gesture,
+            GestureType.RIGHT_CLICK: self._on_right_click_gesture,
+            GestureType.SCROLL_UP: self._on_scroll_up_gesture,
+            GestureType.SCROLL_DOWN: self._on_scroll_down_gesture,
+            GestureType.PALM: self._on_palm_gesture,
+        }
+
+        # 性能优化：合并重复或过于频繁的鼠标移动
+        self._last_move_pos: Optional[tuple[int, int]] = None
+        self._last_move_time = 0.0
+        self._min_move_interval = 0.008
+
     def _init_i18n(self):
         """初始化多语言支持"""
         i18n = get_i18n()
@@ -72,15 +125,18 @@ class LyraPointer:
             # 自动检测系统语言
             i18n.auto_detect_and_set()
 
+    def _load_strings(self):
+        """缓存运行时用到的翻译文本（切换语言后需重新调用）"""
+        self._status_text = {
+            True: t("status.paused"),
+            False: t("status.running"),
+        }
+
     def _init_components(self):
         """初始化所有组件"""
         # 手部追踪器
-        self.tracker = HandTracker(
-            max_hands=1,
-            model_complexity=self.settings.model_complexity,
-            detection_confidence=self.settings.detection_confidence,
-            tracking_confidence=self.settings.tracking_confidence,
-        )
+        self._model_complexity = self.settings.model_complexity
+        self.tracker = self._create_tracker(self._model_complexity)
 
         # 轨迹平滑器
         # smoothing: 0=最跟手, 1=最平滑
@@ -117,6 +173,15 @@ class LyraPointer:
             self.mouse = MouseController()
             print("✅ 使用 PyAutoGUI 控制鼠标 (X11)")
 
+        # 鼠标移动输出线程（可选）：以固定频率插值输出，与摄像头帧率解耦
+        self.cursor_mover: Optional[CursorMover] = None
+        cursor_output_hz = self.settings.cursor_output_hz
+        if cursor_output_hz > 0:
+            self.cursor_mover = CursorMover(self.mouse, rate_hz=cursor_output_hz)
+        elif self.settings.async_cursor:
+            # 不插值，只把鼠标移动移出主循环，旧目标点被合并
+            self.cursor_mover = CursorMover(self.mouse, interpolate=False)
+
         # 可视化器
         self.visualizer = Visualizer(
             show_skeleton=self.settings.show_skeleton,
@@ -126,58 +191,83 @@ class LyraPointer:
         )
         self.visualizer.set_mouse_callback(self._on_mouse_click)
 
-        # 设置窗口
-        self.settings_window = SettingsWindow(
+        # 设置窗口和系统托盘在首次使用时才创建，见 settings_window / tray
+
+        # 摄像头
+        self.cap: Optional[cv2.VideoCapture] = None
+        self.capture: Optional[CaptureThread] = None
+
+    @functools.cached_property
+    def settings_window(self):
+        """设置窗口（首次打开时才导入 Tkinter 并创建）"""
+        from .ui.settings_window import SettingsWindow
+
+        return SettingsWindow(
             settings=self.settings,
             on_save=self._on_settings_save,
             on_close=self._on_settings_close,
         )
 
-        # 系统托盘
-        self.tray = SystemTray(
+    @functools.cached_property
+    def tray(self):
+        """系统托盘（首次使用时才导入 pystray 并创建）"""
+        from .ui.tray import SystemTray
+
+        return SystemTray(
             on_show=self._on_show_window,
             on_hide=self._on_hide_window,
             on_pause=self._on_toggle_pause,
             on_quit=self._on_quit,
         )
 
-        # 摄像头
-        self.cap: Optional[cv2.VideoCapture] = None
+    def _create_tracker(self, model_complexity: int) -> HandTracker:
+        """创建手部追踪器"""
+        return HandTracker(
+            max_hands=1,
+            model_complexity=model_complexity,
+            detection_confidence=self.settings.detection_confidence,
+            tracking_confidence=self.settings.tracking_confidence,
+        )
 
     def _init_camera(self) -> bool:
         """初始化摄像头"""
-        self.cap = cv2.VideoCapture(self.settings.camera_index)
+        index = self.settings.camera_index
+        self.cap = None
+        if sys.platform.startswith("linux"):
+            # 直接使用 V4L2 后端，跳过 GStreamer 的初始化
+            self.cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        if self.cap is None or not self.cap.isOpened():
+            self.cap = cv2.VideoCapture(index)
 
         if not self.cap.isOpened():
             print(f"Error: Cannot open camera {self.settings.camera_index}")
             return False
 
+        # 只保留最新一帧，避免驱动队列中的旧帧增加延迟
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # MJPG 在 USB 摄像头上可在更高分辨率下维持帧率
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.cap.set(cv2.CAP_PROP_FPS, self.settings.camera_fps)
+
         # 设置分辨率
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.settings.camera_width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.settings.camera_height)
 
+        # 实际帧率可能与请求的不同
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        if fps > 0:
+            self._frame_period = 1.0 / fps
+
+        # 后台线程采集，与手部追踪并行
+        self.capture = CaptureThread(self.cap, decode_interval=self._process_interval)
+        self.capture.start()
+
         return True
 
     def _check_wayland(self) -> bool:
         """检查是否在 Wayland 下运行，如果是则显示警告"""
-        session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
-        wayland_display = os.environ.get("WAYLAND_DISPLAY", "")
-
-        if session_type == "wayland" or wayland_display:
-            print("=" * 50)
-            print("  ⚠️  检测到 Wayland 会话")
-            print("=" * 50)
-            print()
-            print("PyAutoGUI 在 Wayland 下可能无法正常控制鼠标。")
-            print()
-            print("解决方案:")
-            print("  1. 切换到 X11 会话登录")
-            print("  2. 或设置环境变量运行:")
-            print("     XDG_SESSION_TYPE=x11 python run.py")
-            print()
-            print("系统托盘功能也可能受限。")
-            print("-" * 50)
-            print()
+        if is_wayland():
+            print(_WAYLAND_WARNING)
             return True
         return False
 
@@ -186,28 +276,35 @@ class LyraPointer:
         # 检查 Wayland
         self._check_wayland()
 
-        print("=" * 50)
-        print(f"  {t('app.title')}")
-        print("=" * 50)
-        print()
-        print(t("hotkey.quit"))
-        print(t("hotkey.pause"))
-        print(t("hotkey.toggle_window"))
-        print()
-        print(t("help.pointer"))
-        print(t("help.click"))
-        print(t("help.right_click"))
-        print(t("help.scroll"))
-        print(t("help.palm"))
-        print(t("help.fist"))
-        print()
+        # 一次输出整个启动信息
+        banner = [
+            "=" * 50,
+            f"  {t('app.title')}",
+            "=" * 50,
+            "",
+            t("hotkey.quit"),
+            t("hotkey.pause"),
+            t("hotkey.toggle_window"),
+            "",
+            t("help.pointer"),
+            t("help.click"),
+            t("help.right_click"),
+            t("help.scroll"),
+            t("help.palm"),
+            t("help.fist"),
+            "",
+        ]
+        print("\n".join(banner))
 
         # 初始化摄像头
         if not self._init_camera():
             return
 
-        # 启动系统托盘
-        if self.tray.available:
+        if self.cursor_mover is not None:
+            self.cursor_mover.start()
+
+        # 启动系统托盘（只在需要时才创建，避免导入 pystray/PIL）
+        if self._use_tray and self.tray.available:
             self.tray.start()
             print("System tray started")
 
@@ -223,89 +320,186 @@ class LyraPointer:
     def _main_loop(self):
         """主循环 - 性能优化版"""
         while self._is_running:
-            # 性能优化：限制处理频率
-            current_time = time.perf_counter()
-            time_since_last = current_time - self._last_process_time
-
-            if time_since_last < self._min_process_interval:
-                # 跳过这一帧，但仍需读取以清空缓冲区
-                self.cap.grab()
-                continue
-
-            self._last_process_time = current_time
-
-            # 读取摄像头
-            ret, frame = self.cap.read()
+            # 性能优化：限制处理频率，睡眠到下一个处理时间点（不忙等）
+            delay = (
+                self._last_process_time
+                + self._min_process_interval
+                - time.perf_counter()
+            )
+            if delay > 0:
+                time.sleep(delay)
+
+            # 等待采集线程的最新一帧，阻塞期间不占用 CPU（后台模式无需额外延迟）
+            ret, frame = self.capture.read(timeout=0.5)
             if not ret:
                 print("Error: Cannot read frame")
                 break
+            if frame is None:
+                continue
 
-            # 帧跳过（用于低性能设备）
-            self._frame_count += 1
-            if self._frame_count % self._process_interval != 0:
+            self._last_process_time = time.perf_counter()
+
+            if not self._show_window:
+                # 后台模式没有渲染可并行，直接处理
+                self._finish_pending_job()
+                self._track_frame(frame)
+                self._update_decode_interval()
                 continue
 
-            # 水平翻转（镜像）
-            frame = cv2.flip(frame, 1)
-
-            # 处理手势
-            gesture = None
-            cursor_pos = None
-
-            if not self._is_paused:
-                gesture, cursor_pos = self._process_frame(frame)
-
-            # 可视化
-            if self._show_window:
-                # 绘制手部骨架
-                if self.tracker._last_landmarks:
-                    frame = self.tracker.draw_landmarks(
-                        frame,
-                        self.tracker._last_landmarks,
-                    )
-
-                # 获取控制区域
-                h, w = frame.shape[:2]
-                control_zone = self.screen.get_zone_rect(w, h)
-
-                # 渲染界面
-                display = self.visualizer.render(
-                    frame,
-                    gesture=gesture,
-                    control_zone=control_zone,
-                    cursor_pos=cursor_pos,
+            if self._pipeline_inference:
+                # 提交当前帧推理，同时渲染上一帧的结果
+                job = self._submit_frame(frame)
+                pending, self._pending_job = self._pending_job, (frame, job)
+                if pending is None:
+                    continue
+                frame, job = pending
+                # 推理线程只产出数据，鼠标操作与状态修改都在主线程执行
+                gesture, cursor_pos, landmarks = self._apply_inference(
+                    frame, job.result()
                 )
-
-                # 显示并处理按键
-                key = self.visualizer.show(display)
-                self._handle_key(key)
             else:
-                # 后台模式，添加小延迟
-                time.sleep(0.01)
+                gesture, cursor_pos, landmarks = self._track_frame(frame)
 
-    def _process_frame(
-        self, frame
-    ) -> tuple[Optional[Gesture], Optional[tuple[int, int]]]:
+            self._render_frame(frame, gesture, cursor_pos, landmarks)
+            self._update_decode_interval()
+
+    def _update_decode_interval(self):
+        """根据本轮处理耗时调整采集线程的解码间隔"""
+        elapsed = time.perf_counter() - self._last_process_time
+        self._loop_time_ewma += self._loop_time_alpha * (elapsed - self._loop_time_ewma)
+
+        # 处理一帧的时间内摄像头产出 N 帧，其中只有最新一帧会被取走
+        skip = int(self._loop_time_ewma / self._frame_period)
+        self.capture.decode_interval = max(self._process_interval, skip)
+
+    def _track_frame(self, frame) -> tuple:
         """
-        处理一帧图像
+        在当前线程中处理一帧
 
         Returns:
-            (手势, 指针位置)
+            (手势, 指针位置, 手部关键点)；本帧未运行追踪（暂停或空闲跳过）时关键点为 None
+        """
+        return self._apply_inference(frame, self._infer_frame(frame))
+
+    def _infer_frame(self, frame) -> tuple:
+        """
+        手部追踪与手势检测（暂停时跳过），可在推理线程中运行
+
+        只访问追踪器与手势检测器，不修改鼠标、平滑器等主线程状态。
+
+        Returns:
+            (追踪结果, 手部关键点)
+        """
+        result = None
+        if not self._is_paused:
+            result = self._process_frame(frame)
+
+        # 只取本帧新产生的关键点，不在新画面上绘制过期的骨架
+        return result, self.tracker.take_new_landmarks()
+
+    def _apply_inference(self, frame, inference: tuple) -> tuple:
+        """
+        在主线程中应用推理结果（执行鼠标操作）
+
+        Returns:
+            (手势, 指针位置, 手部关键点)
+        """
+        result, landmarks = inference
+        # 推理期间可能已暂停，此时不再执行操作
+        if result is None or self._is_paused:
+            return None, None, landmarks
+        gesture, cursor_pos = self._apply_tracking(frame, *result)
+        return gesture, cursor_pos, landmarks
+
+    def _submit_frame(self, frame) -> Future:
+        """在推理线程中处理一帧"""
+        if self._inference_executor is None:
+            self._inference_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="Inference"
+            )
+        return self._inference_executor.submit(self._infer_frame, frame)
+
+    def _finish_pending_job(self):
+        """等待流水线中未取走的推理完成并应用其结果（不再渲染）"""
+        if self._pending_job is not None:
+            (frame, job), self._pending_job = self._pending_job, None
+            # 手势检测器的状态已随该帧推进，必须执行该帧的操作，否则会丢失点击或拖拽
+            self._apply_inference(frame, job.result())
+
+    def _render_frame(self, frame, gesture, cursor_pos, landmarks):
+        """渲染可视化界面并处理按键"""
+        # 窗口被最小化时跳过所有绘制，只处理窗口事件以便窗口恢复；
+        # 被关闭的窗口由 show() 重新创建
+        if self.visualizer.is_window_hidden():
+            self._handle_key(self.visualizer.poll_key())
+            return
+
+        # 水平翻转（镜像），只在显示时原地翻转；追踪结果已按镜像坐标返回
+        cv2.flip(frame, 1, dst=frame)
+
+        # 绘制手部骨架（frame 为本帧独有的副本，直接在其上绘制）
+        if landmarks and self.visualizer.show_skeleton:
+            self.tracker.draw_landmarks(frame, landmarks, copy=False)
+
+        # 获取控制区域
+        control_zone = self._get_zone_rect(frame)
+
+        # 渲染界面
+        display = self.visualizer.render(
+            frame,
+            gesture=gesture,
+            control_zone=control_zone,
+            cursor_pos=cursor_pos,
+            out=frame,  # frame 是本循环私有的副本，直接在其上绘制
+        )
+
+        # 显示并处理按键
+        key = self.visualizer.show(display)
+        self._handle_key(key)
+
+    def _process_frame(self, frame) -> Optional[tuple]:
+        """
+        对一帧图像运行手部追踪与手势检测
+
+        Returns:
+            (推理开始时刻, 推理耗时, 手势, 食指尖端坐标)；未检测到手时手势与坐标为 None，
+            空闲跳过本帧时返回 None
         """
         h, w = frame.shape[:2]
 
+        # 视频模式下 MediaPipe 会用上一帧关键点推算 ROI，只在追踪丢失时才跑手掌检测，
+        # 因此真正昂贵的是无手时每帧的全图检测。长时间无手时跳过部分帧。
+        if self._no_hand_frames >= self._idle_after_frames:
+            self._no_hand_frames += 1
+            if self._no_hand_frames % self._idle_detect_interval != 0:
+                return None
+
+        # 缩小后再做手部追踪，关键点是归一化坐标，不受分辨率影响
+        track_frame = frame
+        if w > self._tracking_width:
+            track_h = int(h * self._tracking_width / w)
+            # 镜像由 tracker 在坐标上完成，这里整帧只被读取一次，
+            # 颜色转换在缩小后的图像上进行
+            self._track_buf = cv2.resize(
+                frame,
+                (self._tracking_width, track_h),
+                dst=self._track_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+            track_frame = self._track_buf
+
         # 手部追踪
-        hands = self.tracker.process(frame)
+        start_time = time.perf_counter()
+        hands = self.tracker.process(track_frame, mirror=True)
+        elapsed = time.perf_counter() - start_time
 
         if not hands:
-            # 没有检测到手，停止拖拽
-            if self._is_dragging:
-                self.mouse.mouse_up()
-                self._is_dragging = False
-            self.smoother.reset()
+            if self._no_hand_frames < self._idle_after_frames:
+                self._no_hand_frames += 1
             self.detector.reset()
-            return None, None
+            return start_time, elapsed, None, None
 
+        self._no_hand_frames = 0
         hand = hands[0]  # 只处理第一只手
 
         # 检测手势
@@ -314,17 +508,43 @@ class LyraPointer:
         # 获取指针位置（食指尖端）
         index_tip = hand.get_finger_tip("index")
 
+        return start_time, elapsed, gesture, (index_tip.x, index_tip.y)
+
+    def _apply_tracking(
+        self, frame, start_time: float, elapsed: float, gesture, tip
+    ) -> tuple[Optional[Gesture], Optional[tuple[int, int]]]:
+        """
+        根据追踪结果移动指针并执行手势操作（主线程）
+
+        Returns:
+            (手势, 指针位置)
+        """
+        self._record_inference_time(elapsed)
+
+        if tip is None:
+            # 没有检测到手，停止拖拽
+            if self._is_dragging:
+                self.mouse.mouse_up()
+                self._is_dragging = False
+            self.smoother.reset()
+            self._last_move_pos = None
+            if self.cursor_mover is not None:
+                self.cursor_mover.reset()
+            return None, None
+
         # 检查是否在控制区域内
-        if not self.screen.is_in_control_zone(index_tip.x, index_tip.y):
+        tip_x, tip_y = tip
+        if not self.screen.is_in_control_zone(tip_x, tip_y):
             return gesture, None
 
-        # 平滑处理
-        smooth_x, smooth_y = self.smoother.smooth(index_tip.x, index_tip.y)
+        # 平滑处理（以推理开始时刻作为本帧时间戳）
+        smooth_x, smooth_y = self.smoother.smooth(tip_x, tip_y, start_time)
 
         # 转换为屏幕坐标
         screen_x, screen_y = self.screen.camera_to_screen(smooth_x, smooth_y)
 
         # 在画面上的显示位置（镜像翻转后）
+        h, w = frame.shape[:2]
         cursor_pixel = (int((1 - smooth_x) * w), int(smooth_y * h))
 
         # 执行操作
@@ -332,107 +552,157 @@ class LyraPointer:
 
         return gesture, cursor_pixel
 
+    def _get_zone_rect(self, frame) -> tuple[int, int, int, int]:
+        """获取控制区域在画面上的矩形（按画面尺寸缓存）"""
+        size = frame.shape[1], frame.shape[0]
+        cache = self._zone_rect_cache
+        if cache is None or cache[0] != size:
+            cache = (size, self.screen.get_zone_rect(*size))
+            self._zone_rect_cache = cache
+        return cache[1]
+
+    def _record_inference_time(self, elapsed: float):
+        """记录推理耗时，持续过慢时自动降低模型复杂度"""
+        if self._model_complexity == 0:
+            return
+
+        times = self._inference_times
+        times.append(elapsed)
+        if len(times) < times.maxlen:
+            return
+
+        median = statistics.median(times)
+        times.clear()
+        if median > self._max_inference_time:
+            print(
+                f"Hand tracking too slow ({median * 1000:.1f} ms/frame), "
+                "switching to lite model (model_complexity=0)"
+            )
+            # 流水线中仍在运行的推理可能正在使用旧追踪器，等它结束后再释放
+            if self._pending_job is not None:
+                wait([self._pending_job[1]])
+            self.tracker.release()
+            self._model_complexity = 0
+            self.tracker = self._create_tracker(0)
+
+    def _move_cursor(self, x: int, y: int, force: bool = False):
+        """
+        移动鼠标，跳过位置未变化或间隔过短的移动
+
+        Args:
+            x: 屏幕 x 坐标
+            y: 屏幕 y 坐标
+            force: 忽略时间间隔限制（点击前必须移动到位）
+        """
+        if self.cursor_mover is not None:
+            # 由输出线程插值移动，点击前直接跳到目标位置。
+            # _last_move_pos 只是最后提交的目标，光标可能仍在插值途中，
+            # 因此 force 时即使目标未变化也要跳转
+            if force:
+                self.cursor_mover.jump_to(x, y)
+            elif (x, y) != self._last_move_pos:
+                self.cursor_mover.set_target(x, y)
+            self._last_move_pos = (x, y)
+            return
+
+        if (x, y) == self._last_move_pos:
+            return
+
+        now = time.perf_counter()
+        if not force and now - self._last_move_time < self._min_move_interval:
+            return
+
+        self.mouse.move_to(x, y)
+        self._last_move_pos = (x, y)
+        self._last_move_time = now
+
     def _execute_gesture(self, gesture: Gesture, x: int, y: int):
         """执行手势对应的操作"""
         gesture_type = gesture.type
 
-        # 指针模式 - 移动鼠标
-        if gesture_type == GestureType.POINTER:
-            if self._is_dragging:
-                self.mouse.move_to(x, y)
-            else:
-                self.mouse.move_to(x, y)
-
-        # 点击 - 在首次检测到时触发
-        elif gesture_type == GestureType.CLICK:
-            # 移动到位置
-            self.mouse.move_to(x, y)
-            # 首次进入点击状态时触发点击
-            if self._last_gesture is None or self._last_gesture.type not in [
-                GestureType.CLICK,
-                GestureType.CLICK_HOLD,
-            ]:
-                self.mouse.click()
-                print(f"[Gesture] Click at ({x}, {y})")
-
-        # 双击
-        elif gesture_type == GestureType.DOUBLE_CLICK:
-            self.mouse.move_to(x, y)
-            # 只在首次检测到双击时触发
-            if (
-                self._last_gesture is None
-                or self._last_gesture.type != GestureType.DOUBLE_CLICK
-            ):
-                self.mouse.double_click()
-                print(f"[Gesture] Double click at ({x}, {y})")
-
-        # 拖拽
-        elif gesture_type == GestureType.CLICK_HOLD:
-            if not self._is_dragging:
-                self.mouse.move_to(x, y)
-                self.mouse.mouse_down()
-                self._is_dragging = True
-                print(f"[Gesture] Drag start at ({x}, {y})")
-            else:
-                self.mouse.move_to(x, y)
-
-        # 右键 - 首次检测到时触发
-        elif gesture_type == GestureType.RIGHT_CLICK:
-            self.mouse.move_to(x, y)
-            if (
-                self._last_gesture is None
-                or self._last_gesture.type != GestureType.RIGHT_CLICK
-            ):
-                self.mouse.right_click()
-                print(f"[Gesture] Right click at ({x}, {y})")
-
-        # 滚动
-        elif gesture_type == GestureType.SCROLL_UP:
-            self.mouse.scroll_up(self.settings.scroll_speed)
-
-        elif gesture_type == GestureType.SCROLL_DOWN:
-            self.mouse.scroll_down(self.settings.scroll_speed)
-
-        # 暂停 - 需要保持一段时间
-        elif gesture_type == GestureType.PALM:
-            if gesture.frames >= 8:
-                if (
-                    self._last_gesture is None
-                    or self._last_gesture.type != GestureType.PALM
-                    or self._last_gesture.frames < 8
-                ):
-                    self._toggle_pause()
-                    print("[Gesture] Palm - toggle pause")
+        action = self._gesture_actions.get(gesture_type)
+        if action is not None:
+            action(gesture, x, y)
 
         # 停止拖拽（当手势变为非捏合状态）
-        if self._is_dragging and gesture_type not in [
-            GestureType.CLICK_HOLD,
-            GestureType.CLICK,
-        ]:
+        if self._is_dragging and gesture_type not in _DRAG_GESTURES:
             self.mouse.mouse_up()
             self._is_dragging = False
             print("[Gesture] Drag end")
 
         self._last_gesture = gesture
 
+    def _on_pointer_gesture(self, gesture: Gesture, x: int, y: int):
+        """指针模式 - 移动鼠标"""
+        self._move_cursor(x, y)
+
+    def _on_click_gesture(self, gesture: Gesture, x: int, y: int):
+        """点击 - 在首次检测到时触发"""
+        # 移动到位置
+        self._move_cursor(x, y, force=True)
+        # 首次进入点击状态时触发点击
+        last = self._last_gesture
+        if last is None or last.type not in _DRAG_GESTURES:
+            self.mouse.click()
+            print(f"[Gesture] Click at ({x}, {y})")
+
+    def _on_double_click_gesture(self, gesture: Gesture, x: int, y: int):
+        """双击 - 只在首次检测到时触发"""
+        self._move_cursor(x, y, force=True)
+        last = self._last_gesture
+        if last is None or last.type is not GestureType.DOUBLE_CLICK:
+            self.mouse.double_click()
+            print(f"[Gesture] Double click at ({x}, {y})")
+
+    def _on_drag_gesture(self, gesture: Gesture, x: int, y: int):
+        """拖拽"""
+        if not self._is_dragging:
+            self._move_cursor(x, y, force=True)
+            self.mouse.mouse_down()
+            self._is_dragging = True
+            print(f"[Gesture] Drag start at ({x}, {y})")
+        else:
+            self._move_cursor(x, y)
+
+    def _on_right_click_gesture(self, gesture: Gesture, x: int, y: int):
+        """右键 - 首次检测到时触发"""
+        self._move_cursor(x, y, force=True)
+        last = self._last_gesture
+        if last is None or last.type is not GestureType.RIGHT_CLICK:
+            self.mouse.right_click()
+            print(f"[Gesture] Right click at ({x}, {y})")
+
+    def _on_scroll_up_gesture(self, gesture: Gesture, x: int, y: int):
+        """向上滚动"""
+        self.mouse.scroll_up(self.settings.scroll_speed)
+
+    def _on_scroll_down_gesture(self, gesture: Gesture, x: int, y: int):
+        """向下滚动"""
+        self.mouse.scroll_down(self.settings.scroll_speed)
+
+    def _on_palm_gesture(self, gesture: Gesture, x: int, y: int):
+        """暂停 - 需要保持一段时间"""
+        if gesture.frames < 8:
+            return
+        last = self._last_gesture
+        if last is None or last.type is not GestureType.PALM or last.frames < 8:
+            self._toggle_pause()
+            print("[Gesture] Palm - toggle pause")
+
     def _handle_key(self, key: int):
         """处理按键"""
-        if key == ord("q") or key == ord("Q"):
-            self._is_running = False
-        elif key == ord("p") or key == ord("P"):
-            self._toggle_pause()
-        elif key == ord("v") or key == ord("V"):
-            self._toggle_window()
+        action = _KEY_ACTIONS.get(key)
+        if action is not None:
+            action(self)
 
     def _toggle_pause(self):
         """切换暂停状态"""
         self._is_paused = not self._is_paused
         self.visualizer.set_paused(self._is_paused)
-        if self.tray.available:
+        if self._use_tray and self.tray.available:
             self.tray.update_status(self._is_paused)
 
-        status = t("status.paused") if self._is_paused else t("status.running")
-        print(f"Control: {status}")
+        print(f"Control: {self._status_text[self._is_paused]}")
 
         # 如果暂停时正在拖拽，停止拖拽
         if self._is_paused and self._is_dragging:
@@ -480,6 +750,10 @@ class LyraPointer:
         self.screen.sensitivity = self.settings.sensitivity
         self.screen.flip_x = self.settings.flip_x
         self.screen.flip_y = self.settings.flip_y
+        self._zone_rect_cache = None
+
+        # 语言可能在设置窗口中被切换
+        self._load_strings()
 
         self.visualizer.show_skeleton = self.settings.show_skeleton
         self.visualizer.show_fps = self.settings.show_fps
@@ -522,17 +796,67 @@ class LyraPointer:
             self.mouse.mouse_up()
 
         # 释放资源
+        capture_stopped = self.capture.stop() if self.capture else True
+
+        if self._inference_executor is not None:
+            self._inference_executor.shutdown(wait=True)
+
+        if self.cursor_mover is not None:
+            self.cursor_mover.stop()
+
         if self.cap:
-            self.cap.release()
+            # 采集线程仍在 grab()/retrieve() 中时不能释放摄像头，交给进程退出时回收
+            if capture_stopped:
+                self.cap.release()
+            else:
+                print("Warning: capture thread did not exit, camera not released")
 
         self.tracker.release()
         self.visualizer.destroy_window()
-        self.tray.stop()
+        # 未创建过的托盘无需停止
+        tray = self.__dict__.get("tray")
+        if tray is not None:
+            tray.stop()
 
         cv2.destroyAllWindows()
         print(t("info.stopped"))
 
 
+# Wayland 警告（一次输出）
+_WAYLAND_WARNING = "\n".join(
+    [
+        "=" * 50,
+        "  ⚠️  检测到 Wayland 会话",
+        "=" * 50,
+        "",
+        "PyAutoGUI 在 Wayland 下可能无法正常控制鼠标。",
+        "",
+        "解决方案:",
+        "  1. 切换到 X11 会话登录",
+        "  2. 或设置环境变量运行:",
+        "     XDG_SESSION_TYPE=x11 python run.py",
+        "",
+        "系统托盘功能也可能受限。",
+        "-" * 50,
+        "",
+    ]
+)
+
+# 保持拖拽的手势，其他手势会结束拖拽
+_DRAG_GESTURES = frozenset((GestureType.CLICK_HOLD, GestureType.CLICK))
+
+# 快捷键 -> 处理方法（大小写均可）
+_KEY_ACTIONS = {
+    ord(char): action
+    for keys, action in (
+        ("qQ", LyraPointer._on_quit),
+        ("pP", LyraPointer._toggle_pause),
+        ("vV", LyraPointer._toggle_window),
+    )
+    for char in keys
+}
+
+
 def main():
     """主入口"""
     parser = argparse.ArgumentParser(description="LyraPointer - 手势控制系统")
@@ -552,7 +876,7 @@ def main():
     parser.add_argument(
         "--no-gui",
         action="store_true",
-        help="无界面模式（仅托盘）",
+        help="无界面模式（不显示窗口和托盘）",
     )
 
     args = parser.parse_args()
@@ -566,6 +890,7 @@ def main():
 
     if args.no_gui:
         app._show_window = False
+        app._use_tray = False
 
     # 运行
     app.run()
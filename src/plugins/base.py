@@ -7,10 +7,10 @@ LyraPointer 插件系统基类
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional
 
 if TYPE_CHECKING:
-    from ..gestures.gestures import Gesture
+    from ..gestures.gestures import Gesture, GestureType
     from ..tracker.hand_tracker import HandLandmarks
 
 
@@ -24,9 +24,9 @@ class PluginType(Enum):
     FEEDBACK = auto()  # 反馈插件
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
-    """插件信息"""
+    """插件信息（使用 __slots__，不能添加未声明的属性）"""
 
     name: str
     version: str = "1.0.0"
@@ -37,11 +37,37 @@ class PluginInfo:
     priority: int = 0  # 优先级，数字越大越先执行
     dependencies: List[str] = field(default_factory=list)
     config_schema: Optional[Dict] = None  # 配置项定义
+    # 触发动作插件的手势类型，None 表示所有手势（仅对动作插件有效）
+    triggers: Optional[FrozenSet["GestureType"]] = None
 
     def __str__(self) -> str:
         return f"{self.name} v{self.version} by {self.author}"
 
 
+def _compile_config_rules(schema: Optional[Dict]) -> tuple:
+    """
+    将配置项定义展开为 (键, 是否必填, 类型, 最小值, 最大值) 元组
+
+    Args:
+        schema: PluginInfo.config_schema
+
+    Returns:
+        验证规则元组
+    """
+    if not schema:
+        return ()
+    return tuple(
+        (
+            key,
+            bool(rules.get("required")),
+            rules.get("type"),
+            rules.get("min"),
+            rules.get("max"),
+        )
+        for key, rules in schema.items()
+    )
+
+
 class Plugin(ABC):
     """
     插件基类
@@ -59,8 +85,20 @@ class Plugin(ABC):
         ...
         ...     def initialize(self):
         ...         print("Plugin initialized")
+
+    Note:
+        info.config_schema 视为类级常量：首次验证配置时读取并缓存在类上，
+        同一插件类的所有实例共用。
     """
 
+    # 按插件类缓存的配置验证规则，见 validate_config
+    _config_rules_cache: Optional[tuple] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 每个子类使用自己的缓存，不继承父类已读取的定义
+        cls._config_rules_cache = None
+
     def __init__(self):
         self._config: Dict[str, Any] = {}
         self._enabled = True
@@ -158,27 +196,31 @@ class Plugin(ABC):
             错误消息列表，如果为空则验证通过
         """
         errors = []
-        schema = self.info.config_schema
-
-        if schema:
-            for key, rules in schema.items():
-                if rules.get("required") and key not in config:
+        cls = type(self)
+        rules = cls._config_rules_cache
+        if rules is None:
+            # info 通常每次访问都会新建 PluginInfo，只读取并展开一次
+            rules = cls._config_rules_cache = _compile_config_rules(
+                self.info.config_schema
+            )
+
+        for key, required, expected_type, min_val, max_val in rules:
+            if key not in config:
+                if required:
                     errors.append(f"Missing required config: {key}")
-                elif key in config:
-                    value = config[key]
-                    expected_type = rules.get("type")
-                    if expected_type and not isinstance(value, expected_type):
-                        errors.append(
-                            f"Invalid type for {key}: "
-                            f"expected {expected_type.__name__}, "
-                            f"got {type(value).__name__}"
-                        )
-                    min_val = rules.get("min")
-                    max_val = rules.get("max")
-                    if min_val is not None and value < min_val:
-                        errors.append(f"{key} must be >= {min_val}")
-                    if max_val is not None and value > max_val:
-                        errors.append(f"{key} must be <= {max_val}")
+                continue
+
+            value = config[key]
+            if expected_type and not isinstance(value, expected_type):
+                errors.append(
+                    f"Invalid type for {key}: "
+                    f"expected {expected_type.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+            if min_val is not None and value < min_val:
+                errors.append(f"{key} must be >= {min_val}")
+            if max_val is not None and value > max_val:
+                errors.append(f"{key} must be <= {max_val}")
 
         return errors
 
@@ -268,7 +310,8 @@ class ActionPlugin(Plugin):
         ...         return PluginInfo(
         ...             name="Screenshot",
         ...             plugin_type=PluginType.ACTION,
-        ...             description="Take screenshot on gesture"
+        ...             description="Take screenshot on gesture",
+        ...             triggers=frozenset({GestureType.PALM}),
         ...         )
         ...
         ...     def execute(self, gesture, context):
@@ -302,6 +345,9 @@ class ActionPlugin(Plugin):
         """
         检查是否可以执行动作
 
+        启用状态与 info.triggers 已由 PluginManager 预先筛选，
+        只有重写了此方法的插件才会在分发时被调用。
+
         Args:
             gesture: 手势
             context: 上下文
@@ -4,12 +4,13 @@ LyraPointer 插件管理器
 负责插件的加载、卸载、管理和执行。
 """
 
+import bisect
 import importlib
 import importlib.util
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from ..utils.logging import get_logger
 from .base import (
@@ -25,6 +26,24 @@ from .base import (
 
 logger = get_logger(__name__)
 
+# 插件类型 -> 该类型插件必须继承的基类
+_TYPE_BASES: Dict[PluginType, Type[Plugin]] = {
+    PluginType.GESTURE: GesturePlugin,
+    PluginType.ACTION: ActionPlugin,
+    PluginType.FILTER: FilterPlugin,
+    PluginType.VISUALIZER: VisualizerPlugin,
+    PluginType.FEEDBACK: FeedbackPlugin,
+}
+
+
+def _priority_key(plugin: Plugin) -> int:
+    """类型缓存排序键：优先级高的在前"""
+    return -plugin.info.priority
+
+
+# 插件文件中不作为插件类的基类
+_BASE_CLASSES = (Plugin, *_TYPE_BASES.values())
+
 
 @dataclass
 class PluginEntry:
@@ -65,12 +84,12 @@ class PluginManager:
         self._plugin_dirs: List[Path] = plugin_dirs or []
         self._load_counter = 0
 
-        # 按类型分类的插件缓存
-        self._gesture_plugins: List[GesturePlugin] = []
-        self._action_plugins: List[ActionPlugin] = []
-        self._filter_plugins: List[FilterPlugin] = []
-        self._visualizer_plugins: List[VisualizerPlugin] = []
-        self._feedback_plugins: List[FeedbackPlugin] = []
+        # 按类型分类的插件缓存，按优先级排序（同优先级保持注册顺序）
+        self._type_plugins: Dict[PluginType, List[Plugin]] = {t: [] for t in PluginType}
+
+        # 手势类型 -> [(动作插件, 是否需要调用 can_execute)]，按需构建，注册/注销时清空。
+        # 不含启用状态：Plugin.enabled 可被直接修改，读取时再筛选
+        self._action_index: Dict[Any, Tuple[Tuple[ActionPlugin, bool], ...]] = {}
 
         # 插件事件回调
         self._on_load_callbacks: List[Callable[[Plugin], None]] = []
@@ -164,53 +183,41 @@ class PluginManager:
 
     def _add_to_type_cache(self, plugin: Plugin, plugin_type: PluginType):
         """添加到类型缓存"""
-        if plugin_type == PluginType.GESTURE and isinstance(plugin, GesturePlugin):
-            self._gesture_plugins.append(plugin)
-            self._gesture_plugins.sort(key=lambda p: -p.info.priority)
-        elif plugin_type == PluginType.ACTION and isinstance(plugin, ActionPlugin):
-            self._action_plugins.append(plugin)
-            self._action_plugins.sort(key=lambda p: -p.info.priority)
-        elif plugin_type == PluginType.FILTER and isinstance(plugin, FilterPlugin):
-            self._filter_plugins.append(plugin)
-            self._filter_plugins.sort(key=lambda p: -p.info.priority)
-        elif plugin_type == PluginType.VISUALIZER and isinstance(
-            plugin, VisualizerPlugin
-        ):
-            self._visualizer_plugins.append(plugin)
-            self._visualizer_plugins.sort(key=lambda p: -p.info.priority)
-        elif plugin_type == PluginType.FEEDBACK and isinstance(plugin, FeedbackPlugin):
-            self._feedback_plugins.append(plugin)
-            self._feedback_plugins.sort(key=lambda p: -p.info.priority)
+        base = _TYPE_BASES.get(plugin_type)
+        if base is None or not isinstance(plugin, base):
+            return
+        bisect.insort(self._type_plugins[plugin_type], plugin, key=_priority_key)
+        if plugin_type is PluginType.ACTION:
+            self._action_index.clear()
 
     def _remove_from_type_cache(self, plugin: Plugin, plugin_type: PluginType):
         """从类型缓存移除"""
-        if plugin_type == PluginType.GESTURE:
-            if plugin in self._gesture_plugins:
-                self._gesture_plugins.remove(plugin)
-        elif plugin_type == PluginType.ACTION:
-            if plugin in self._action_plugins:
-                self._action_plugins.remove(plugin)
-        elif plugin_type == PluginType.FILTER:
-            if plugin in self._filter_plugins:
-                self._filter_plugins.remove(plugin)
-        elif plugin_type == PluginType.VISUALIZER:
-            if plugin in self._visualizer_plugins:
-                self._visualizer_plugins.remove(plugin)
-        elif plugin_type == PluginType.FEEDBACK:
-            if plugin in self._feedback_plugins:
-                self._feedback_plugins.remove(plugin)
+        plugins = self._type_plugins.get(plugin_type)
+        if plugins and plugin in plugins:
+            plugins.remove(plugin)
+            if plugin_type is PluginType.ACTION:
+                self._action_index.clear()
+
+    def _enabled_plugins(self, plugin_type: PluginType) -> Tuple[Plugin, ...]:
+        """
+        获取指定类型的已启用插件（按优先级排序）
+
+        启用状态每次读取时检查：Plugin.enabled 可以绕过管理器直接修改，
+        并且还取决于 info.enabled，无法可靠地缓存。
+        """
+        return tuple(p for p in self._type_plugins[plugin_type] if p.enabled)
 
     def _check_dependencies(self, info: PluginInfo) -> bool:
         """检查插件依赖"""
-        for dep in info.dependencies:
-            if dep not in self._plugins:
-                return False
-        return True
+        return self._plugins.keys() >= set(info.dependencies)
 
     def load_from_file(self, file_path: Union[str, Path]) -> Optional[Plugin]:
         """
         从文件加载插件
 
+        插件模块可以用 ``__plugin__ = MyPlugin`` 显式指定插件类，
+        否则取模块中第一个插件子类。
+
         Args:
             file_path: 插件文件路径
 
@@ -238,27 +245,31 @@ class PluginManager:
 
             module = importlib.util.module_from_spec(spec)
             sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            # 查找插件类
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, Plugin)
-                    and attr is not Plugin
-                    and attr
-                    not in (
-                        GesturePlugin,
-                        ActionPlugin,
-                        FilterPlugin,
-                        VisualizerPlugin,
-                        FeedbackPlugin,
-                    )
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                # 不保留执行失败的半初始化模块
+                sys.modules.pop(module_name, None)
+                raise
+
+            # 查找插件类：优先使用模块声明的 __plugin__
+            plugin_class = getattr(module, "__plugin__", None)
+            if plugin_class is not None:
+                if not (
+                    isinstance(plugin_class, type) and issubclass(plugin_class, Plugin)
                 ):
-                    plugin_class = attr
-                    break
+                    logger.error(f"__plugin__ is not a plugin class in: {file_path}")
+                    return None
+            else:
+                for attr_name in dir(module):
+                    attr = getattr(module, attr_name)
+                    if (
+                        isinstance(attr, type)
+                        and attr not in _BASE_CLASSES
+                        and issubclass(attr, Plugin)
+                    ):
+                        plugin_class = attr
+                        break
 
             if plugin_class is None:
                 logger.error(f"No plugin class found in: {file_path}")
@@ -363,37 +374,85 @@ class PluginManager:
         Returns:
             插件列表
         """
-        if plugin_type == PluginType.GESTURE:
-            return list(self._gesture_plugins)
-        elif plugin_type == PluginType.ACTION:
-            return list(self._action_plugins)
-        elif plugin_type == PluginType.FILTER:
-            return list(self._filter_plugins)
-        elif plugin_type == PluginType.VISUALIZER:
-            return list(self._visualizer_plugins)
-        elif plugin_type == PluginType.FEEDBACK:
-            return list(self._feedback_plugins)
-        return []
-
-    def get_gesture_plugins(self) -> List[GesturePlugin]:
+        if plugin_type not in self._type_plugins:
+            return []
+        return list(self._type_plugins[plugin_type])
+
+    def get_gesture_plugins(self) -> Tuple[GesturePlugin, ...]:
         """获取所有手势插件"""
-        return [p for p in self._gesture_plugins if p.enabled]
+        return self._enabled_plugins(PluginType.GESTURE)
 
-    def get_action_plugins(self) -> List[ActionPlugin]:
+    def get_action_plugins(self) -> Tuple[ActionPlugin, ...]:
         """获取所有动作插件"""
-        return [p for p in self._action_plugins if p.enabled]
+        return self._enabled_plugins(PluginType.ACTION)
+
+    def get_action_plugins_for(
+        self, gesture_type: Any
+    ) -> Tuple[Tuple[ActionPlugin, bool], ...]:
+        """
+        获取由指定手势触发的已启用动作插件
+
+        触发条件的匹配结果按手势类型缓存（插件注册/注销时失效），启用状态每次读取时检查。
+
+        Args:
+            gesture_type: 手势类型
+
+        Returns:
+            (插件, 是否需要调用 can_execute) 元组，按优先级排序
+        """
+        return tuple(
+            entry for entry in self._action_candidates(gesture_type) if entry[0].enabled
+        )
+
+    def _action_candidates(
+        self, gesture_type: Any
+    ) -> Tuple[Tuple[ActionPlugin, bool], ...]:
+        """获取由指定手势触发的所有动作插件（含未启用的），按手势类型缓存"""
+        plugins = self._action_index.get(gesture_type)
+        if plugins is None:
+            plugins = tuple(
+                (p, type(p).can_execute is not ActionPlugin.can_execute)
+                for p in self._type_plugins[PluginType.ACTION]
+                if p.info.triggers is None or gesture_type in p.info.triggers
+            )
+            self._action_index[gesture_type] = plugins
+        return plugins
+
+    def execute_actions(self, gesture: Any, context: Dict[str, Any]) -> int:
+        """
+        执行由手势触发的所有动作插件
+
+        Args:
+            gesture: 触发的手势
+            context: 上下文信息
+
+        Returns:
+            成功执行的插件数量
+        """
+        executed = 0
+        for plugin, check in self._action_candidates(gesture.type):
+            if not plugin.enabled:
+                continue
+            if check and not plugin.can_execute(gesture, context):
+                continue
+            try:
+                if plugin.execute(gesture, context):
+                    executed += 1
+            except Exception as e:
+                logger.error(f"Error executing plugin '{plugin.name}': {e}")
+        return executed
 
-    def get_filter_plugins(self) -> List[FilterPlugin]:
+    def get_filter_plugins(self) -> Tuple[FilterPlugin, ...]:
         """获取所有过滤器插件"""
-        return [p for p in self._filter_plugins if p.enabled]
+        return self._enabled_plugins(PluginType.FILTER)
 
-    def get_visualizer_plugins(self) -> List[VisualizerPlugin]:
+    def get_visualizer_plugins(self) -> Tuple[VisualizerPlugin, ...]:
         """获取所有可视化插件"""
-        return [p for p in self._visualizer_plugins if p.enabled]
+        return self._enabled_plugins(PluginType.VISUALIZER)
 
-    def get_feedback_plugins(self) -> List[FeedbackPlugin]:
+    def get_feedback_plugins(self) -> Tuple[FeedbackPlugin, ...]:
         """获取所有反馈插件"""
-        return [p for p in self._feedback_plugins if p.enabled]
+        return self._enabled_plugins(PluginType.FEEDBACK)
 
     def initialize_all(self):
         """初始化所有已注册的插件"""
@@ -498,8 +557,9 @@ class PluginManager:
             logger.error(f"Cannot reload plugin '{name}': no module path")
             return False
 
-        # 卸载
+        # 卸载，并丢弃旧模块
         self.unregister(name)
+        sys.modules.pop(f"lyrapointer_plugin_{Path(module_path).stem}", None)
 
         # 重新加载
         plugin = self.load_from_file(module_path)
@@ -1,6 +1,15 @@
 """手部追踪模块"""
 
-from .hand_tracker import HandTracker
+from .capture import CaptureThread
 from .smoother import Smoother, OneEuroFilter
 
-__all__ = ["HandTracker", "Smoother", "OneEuroFilter"]
+__all__ = ["CaptureThread", "HandTracker", "Smoother", "OneEuroFilter"]
+
+
+def __getattr__(name: str):
+    # HandTracker 依赖 MediaPipe，按需导入以加快启动
+    if name == "HandTracker":
+        from .hand_tracker import HandTracker
+
+        return HandTracker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
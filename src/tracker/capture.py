@@ -0,0 +1,140 @@
+"""
+摄像头采集线程
+
+在后台线程中持续读取摄像头，只保留最新一帧，
+使 USB/V4L2 采集与 MediaPipe 推理并行进行。
+"""
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CaptureThread:
+    """
+    后台摄像头采集线程
+
+    采集线程不断 grab()，并按 decode_interval 选择性地 retrieve()（解码）。
+    解码结果写入双缓冲中的后台缓冲区，完成后在锁内与前台缓冲区交换。主线程通过 read() 取得最新一帧的副本。
+
+    Example:
+        >>> capture = CaptureThread(cv2.VideoCapture(0))
+        >>> capture.start()
+        >>> ret, frame = capture.read(timeout=1.0)
+        >>> capture.stop()
+    """
+
+    def __init__(self, cap, decode_interval: int = 1):
+        """
+        初始化采集线程
+
+        Args:
+            cap: 已打开的 cv2.VideoCapture（或具有 grab/retrieve 接口的对象）
+            decode_interval: 每隔多少帧解码一次，其余帧只 grab 不解码
+        """
+        self._cap = cap
+        self.decode_interval = max(1, int(decode_interval))
+        self._grab_count = 0
+        self._lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # 双缓冲：_buffers[_front] 为最新完成的帧，另一个供采集线程写入
+        self._buffers: list[Optional[np.ndarray]] = [None, None]
+        self._front = 0
+        self._ret = False
+
+    @property
+    def is_running(self) -> bool:
+        """采集线程是否在运行"""
+        return self._running
+
+    def start(self):
+        """启动采集线程"""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="CaptureThread", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """
+        停止采集线程
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+
+        Returns:
+            采集线程是否已退出。返回 False 时线程可能仍阻塞在 grab()/retrieve() 中，
+            此时不能释放摄像头
+        """
+        self._running = False
+        # 唤醒可能正在等待新帧的 read()
+        self._new_frame.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+            self._thread = None
+        return True
+
+    def read(
+        self, timeout: Optional[float] = None
+    ) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        等待并读取最新一帧
+
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
+
+        Returns:
+            (是否成功, 帧图像副本)。超时返回 (True, None)，
+            采集失败或线程已停止返回 (False, None)
+        """
+        if not self._new_frame.wait(timeout):
+            return True, None
+
+        with self._lock:
+            self._new_frame.clear()
+            frame = self._buffers[self._front]
+            if not self._ret or frame is None:
+                return False, None
+            return True, frame.copy()
+
+    def _run(self):
+        """采集循环"""
+        while self._running:
+            if not self._cap.grab():
+                logger.error("Camera grab failed, capture thread exiting")
+                break
+
+            # 帧跳过：只 grab 推进驱动队列，不做解码
+            self._grab_count += 1
+            if self._grab_count % self.decode_interval != 0:
+                continue
+
+            back = 1 - self._front
+            ret, frame = self._cap.retrieve(self._buffers[back])
+            if not ret:
+                logger.error("Camera retrieve failed, capture thread exiting")
+                break
+
+            with self._lock:
+                self._buffers[back] = frame
+                self._front = back
+                self._ret = True
+            self._new_frame.set()
+
+        with self._lock:
+            self._ret = False
+        self._running = False
+        self._new_frame.set()
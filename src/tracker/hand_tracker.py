@@ -2,16 +2,39 @@
 手部追踪器 - 封装 MediaPipe Hands
 
 使用 MediaPipe 进行实时手部追踪，返回 21 个手部关键点。
+MediaPipe 在创建 HandTracker 时才导入，只使用关键点数据类的模块不必加载它。
 """
 
 from dataclasses import dataclass
 from typing import Optional
 import cv2
-import mediapipe as mp
 import numpy as np
 
 
-@dataclass
+# 镜像时左右手标签互换
+_MIRRORED_HANDEDNESS = {"Left": "Right", "Right": "Left"}
+
+# 骨架连接线
+_HAND_CONNECTIONS = (
+    # 拇指
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    # 食指
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    # 中指
+    (0, 9), (9, 10), (10, 11), (11, 12),
+    # 无名指
+    (0, 13), (13, 14), (14, 15), (15, 16),
+    # 小指
+    (0, 17), (17, 18), (18, 19), (19, 20),
+    # 手掌
+    (5, 9), (9, 13), (13, 17),
+)
+
+# 手指尖端关键点索引
+_TIP_INDICES = frozenset({4, 8, 12, 16, 20})
+
+
+@dataclass(slots=True)
 class Point3D:
     """3D 坐标点"""
     x: float
@@ -27,7 +50,7 @@ class Point3D:
         return (int(self.x * width), int(self.y * height))
 
 
-@dataclass
+@dataclass(slots=True)
 class HandLandmarks:
     """手部关键点数据"""
     # 21 个关键点
@@ -125,6 +148,8 @@ class HandTracker:
             detection_confidence: 检测置信度阈值
             tracking_confidence: 追踪置信度阈值
         """
+        import mediapipe as mp
+
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
@@ -138,22 +163,33 @@ class HandTracker:
         )
         
         self._last_landmarks: Optional[list[HandLandmarks]] = None
+        # process() 产生新结果后置位，由 take_new_landmarks() 清除
+        self._landmarks_dirty = False
+        # 复用的 RGB 缓冲区，避免每帧分配
+        self._rgb_buf: Optional[np.ndarray] = None
     
-    def process(self, frame: np.ndarray) -> list[HandLandmarks]:
+    def process(self, frame: np.ndarray, mirror: bool = False) -> list[HandLandmarks]:
         """
         处理一帧图像，返回手部关键点列表
         
         Args:
             frame: BGR 格式的图像帧
+            mirror: 是否按水平镜像后的画面返回结果（x 取反、左右手互换），
+                效果等同于先 cv2.flip(frame, 1) 再处理，但无需复制整帧
             
         Returns:
             手部关键点列表
         """
-        # 转换为 RGB (MediaPipe 需要)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # 转换为 RGB (MediaPipe 需要)，尺寸不变时写入同一缓冲区
+        if self._rgb_buf is not None:
+            self._rgb_buf.flags.writeable = True
+        self._rgb_buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # 标记为只读后 MediaPipe 直接引用缓冲区，不再复制一份
+        self._rgb_buf.flags.writeable = False
         
         # 处理图像
-        results = self.hands.process(rgb_frame)
+        results = self.hands.process(self._rgb_buf)
         
         hands_data: list[HandLandmarks] = []
         
@@ -163,13 +199,21 @@ class HandTracker:
                 results.multi_handedness
             ):
                 # 提取关键点
-                landmarks = [
-                    Point3D(lm.x, lm.y, lm.z)
-                    for lm in hand_landmarks.landmark
-                ]
+                if mirror:
+                    landmarks = [
+                        Point3D(1.0 - lm.x, lm.y, lm.z)
+                        for lm in hand_landmarks.landmark
+                    ]
+                else:
+                    landmarks = [
+                        Point3D(lm.x, lm.y, lm.z)
+                        for lm in hand_landmarks.landmark
+                    ]
                 
                 # 获取手的类型和置信度
                 hand_type = handedness.classification[0].label
+                if mirror:
+                    hand_type = _MIRRORED_HANDEDNESS.get(hand_type, hand_type)
                 score = handedness.classification[0].score
                 
                 hands_data.append(HandLandmarks(
@@ -179,13 +223,27 @@ class HandTracker:
                 ))
         
         self._last_landmarks = hands_data
+        self._landmarks_dirty = True
         return hands_data
     
+    def take_new_landmarks(self) -> Optional[list[HandLandmarks]]:
+        """
+        取出上次读取之后 process() 新产生的手部关键点
+        
+        Returns:
+            新的手部关键点列表；自上次调用以来没有运行过 process() 时返回 None
+        """
+        if not self._landmarks_dirty:
+            return None
+        self._landmarks_dirty = False
+        return self._last_landmarks
+    
     def draw_landmarks(
         self,
         frame: np.ndarray,
         hands_data: list[HandLandmarks],
         draw_connections: bool = True,
+        copy: bool = True,
     ) -> np.ndarray:
         """
         在图像上绘制手部骨架
@@ -194,46 +252,33 @@ class HandTracker:
             frame: 图像帧
             hands_data: 手部关键点数据
             draw_connections: 是否绘制连接线
+            copy: 是否在副本上绘制；为 False 时直接修改传入的 frame
             
         Returns:
             绘制后的图像
         """
-        annotated_frame = frame.copy()
+        annotated_frame = frame.copy() if copy else frame
         h, w = frame.shape[:2]
         
         for hand in hands_data:
+            # 每个关键点只投影一次，关键点和连接线共用
+            pixels = [(int(p.x * w), int(p.y * h)) for p in hand.landmarks]
+            
             # 绘制关键点
-            for i, point in enumerate(hand.landmarks):
-                cx, cy = point.to_pixel(w, h)
-                
+            for i, center in enumerate(pixels):
                 # 手指尖端用较大的圆
-                if i in [4, 8, 12, 16, 20]:
-                    cv2.circle(annotated_frame, (cx, cy), 8, (0, 255, 0), -1)
-                    cv2.circle(annotated_frame, (cx, cy), 10, (255, 255, 255), 2)
+                if i in _TIP_INDICES:
+                    cv2.circle(annotated_frame, center, 8, (0, 255, 0), -1)
+                    cv2.circle(annotated_frame, center, 10, (255, 255, 255), 2)
                 else:
-                    cv2.circle(annotated_frame, (cx, cy), 5, (0, 200, 0), -1)
+                    cv2.circle(annotated_frame, center, 5, (0, 200, 0), -1)
             
             if draw_connections:
                 # 绘制骨架连接
-                connections = [
-                    # 拇指
-                    (0, 1), (1, 2), (2, 3), (3, 4),
-                    # 食指
-                    (0, 5), (5, 6), (6, 7), (7, 8),
-                    # 中指
-                    (0, 9), (9, 10), (10, 11), (11, 12),
-                    # 无名指
-                    (0, 13), (13, 14), (14, 15), (15, 16),
-                    # 小指
-                    (0, 17), (17, 18), (18, 19), (19, 20),
-                    # 手掌
-                    (5, 9), (9, 13), (13, 17),
-                ]
-                
-                for start, end in connections:
-                    p1 = hand.landmarks[start].to_pixel(w, h)
-                    p2 = hand.landmarks[end].to_pixel(w, h)
-                    cv2.line(annotated_frame, p1, p2, (0, 255, 0), 2)
+                for start, end in _HAND_CONNECTIONS:
+                    cv2.line(
+                        annotated_frame, pixels[start], pixels[end], (0, 255, 0), 2
+                    )
         
         return annotated_frame
     
@@ -13,10 +13,22 @@
 
 import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Optional, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# 1 / (2π)：平滑系数 alpha = te / (te + tau)，其中 tau = 1 / (2π · cutoff)
+_INV_TWO_PI = 1.0 / (2 * math.pi)
+
 
 class SmoothingPreset(Enum):
     """平滑预设模式"""
@@ -27,9 +39,9 @@ class SmoothingPreset(Enum):
     CUSTOM = "custom"  # 自定义
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SmoothingParams:
-    """平滑参数"""
+    """平滑参数（不可变，预设表中的实例被共享）"""
 
     min_cutoff: float  # 最小截止频率 (越小越平滑)
     beta: float  # 速度系数 (越大对速度变化越敏感)
@@ -38,33 +50,7 @@ class SmoothingParams:
     @classmethod
     def from_preset(cls, preset: SmoothingPreset) -> "SmoothingParams":
         """从预设创建参数"""
-        presets = {
-            # 响应优先：高 min_cutoff，高 beta，快速响应
-            SmoothingPreset.RESPONSIVE: cls(
-                min_cutoff=1.5,
-                beta=0.5,
-                d_cutoff=1.0,
-            ),
-            # 平衡模式：中等参数
-            SmoothingPreset.BALANCED: cls(
-                min_cutoff=0.8,
-                beta=0.4,
-                d_cutoff=1.0,
-            ),
-            # 稳定优先：低 min_cutoff，低 beta，更平滑
-            SmoothingPreset.STABLE: cls(
-                min_cutoff=0.3,
-                beta=0.1,
-                d_cutoff=1.0,
-            ),
-            # 自定义默认值
-            SmoothingPreset.CUSTOM: cls(
-                min_cutoff=0.8,
-                beta=0.4,
-                d_cutoff=1.0,
-            ),
-        }
-        return presets.get(preset, presets[SmoothingPreset.BALANCED])
+        return _PRESET_TABLE.get(preset, _PRESET_TABLE[SmoothingPreset.BALANCED])
 
     @classmethod
     def from_smoothing_value(cls, smoothing: float) -> "SmoothingParams":
@@ -95,9 +81,40 @@ class SmoothingParams:
         )
 
 
+# 预设参数表，模块加载时构建一次
+_PRESET_TABLE = {
+    # 响应优先：高 min_cutoff，高 beta，快速响应
+    SmoothingPreset.RESPONSIVE: SmoothingParams(
+        min_cutoff=1.5,
+        beta=0.5,
+        d_cutoff=1.0,
+    ),
+    # 平衡模式：中等参数
+    SmoothingPreset.BALANCED: SmoothingParams(
+        min_cutoff=0.8,
+        beta=0.4,
+        d_cutoff=1.0,
+    ),
+    # 稳定优先：低 min_cutoff，低 beta，更平滑
+    SmoothingPreset.STABLE: SmoothingParams(
+        min_cutoff=0.3,
+        beta=0.1,
+        d_cutoff=1.0,
+    ),
+    # 自定义默认值
+    SmoothingPreset.CUSTOM: SmoothingParams(
+        min_cutoff=0.8,
+        beta=0.4,
+        d_cutoff=1.0,
+    ),
+}
+
+
 class LowPassFilter:
     """低通滤波器"""
 
+    __slots__ = ("_alpha", "_last_value")
+
     def __init__(self, alpha: float = 0.5):
         """
         初始化低通滤波器
@@ -148,6 +165,8 @@ class OneEuroFilter:
     - 高速运动时响应快（减少延迟）
     """
 
+    __slots__ = ("min_cutoff", "beta", "d_cutoff", "_x_prev", "_dx_prev", "_last_time")
+
     def __init__(
         self,
         min_cutoff: float = 0.8,
@@ -166,19 +185,24 @@ class OneEuroFilter:
         self.beta = beta
         self.d_cutoff = d_cutoff
 
-        self._x_filter = LowPassFilter()
-        self._dx_filter = LowPassFilter()
+        # 两个低通滤波（值和导数）直接内联在 filter() 中
+        self._x_prev: Optional[float] = None
+        self._dx_prev = 0.0
         self._last_time: Optional[float] = None
 
-    def _compute_alpha(self, cutoff: float, te: float) -> float:
-        """计算平滑系数"""
-        tau = 1.0 / (2 * math.pi * cutoff)
-        return 1.0 / (1.0 + tau / te)
-
-    def filter(self, value: float, timestamp: Optional[float] = None) -> float:
+    def filter(
+        self,
+        value: float,
+        timestamp: Optional[float] = None,
+        _perf_counter=time.perf_counter,
+        _inv_two_pi=_INV_TWO_PI,
+        _abs=abs,
+    ) -> float:
         """
         过滤值
 
+        以下划线开头的参数只是把全局名绑定为局部变量以加快查找，调用时不要传入。
+
         Args:
             value: 输入值
             timestamp: 时间戳 (秒)
@@ -187,13 +211,13 @@ class OneEuroFilter:
             过滤后的值
         """
         if timestamp is None:
-            timestamp = time.perf_counter()
+            timestamp = _perf_counter()
 
         if self._last_time is None:
             # 第一次调用，直接返回
             self._last_time = timestamp
-            self._x_filter.filter(value)
-            self._dx_filter.filter(0.0)
+            self._x_prev = value
+            self._dx_prev = 0.0
             return value
 
         # 计算时间间隔
@@ -202,25 +226,26 @@ class OneEuroFilter:
             te = 1e-6
         self._last_time = timestamp
 
-        # 计算导数（速度）
-        dx = 0.0
-        if self._x_filter.last_value is not None:
-            dx = (value - self._x_filter.last_value) / te
-
-        # 过滤导数
-        edx = self._dx_filter.filter(dx, self._compute_alpha(self.d_cutoff, te))
+        # 计算并过滤导数（速度）
+        x_prev = self._x_prev
+        d_alpha = te / (te + _inv_two_pi / self.d_cutoff)
+        edx = d_alpha * ((value - x_prev) / te) + (1 - d_alpha) * self._dx_prev
+        self._dx_prev = edx
 
         # 根据速度动态调整截止频率
         # 速度越快，cutoff 越大，响应越快
-        cutoff = self.min_cutoff + self.beta * abs(edx)
+        cutoff = self.min_cutoff + self.beta * _abs(edx)
 
         # 过滤值
-        return self._x_filter.filter(value, self._compute_alpha(cutoff, te))
+        alpha = te / (te + _inv_two_pi / cutoff)
+        x = alpha * value + (1 - alpha) * x_prev
+        self._x_prev = x
+        return x
 
     def reset(self):
         """重置滤波器状态"""
-        self._x_filter.reset()
-        self._dx_filter.reset()
+        self._x_prev = None
+        self._dx_prev = 0.0
         self._last_time = None
 
     def set_params(self, min_cutoff: float, beta: float, d_cutoff: float = 1.0):
@@ -230,6 +255,89 @@ class OneEuroFilter:
         self.d_cutoff = d_cutoff
 
 
+def _one_euro_step(
+    x: float,
+    y: float,
+    timestamp: float,
+    state: np.ndarray,
+    min_cutoff: float,
+    beta: float,
+    d_cutoff: float,
+) -> Tuple[float, float]:
+    """
+    对 (x, y) 同时执行一步 One Euro 滤波
+
+    与两个独立的 OneEuroFilter 结果一致，两个轴共用时间间隔和导数平滑系数。
+    状态保存在长度为 6 的序列中：
+    [last_x, last_y, last_dx, last_dy, last_time, initialized]。
+    安装 numba 时会被编译为本地代码（状态为 float64 数组），否则直接以 Python 列表为状态运行。
+
+    Returns:
+        滤波后的 (x, y)
+    """
+    if state[5] == 0.0:
+        # 第一次调用，直接返回
+        state[0] = x
+        state[1] = y
+        state[2] = 0.0
+        state[3] = 0.0
+        state[4] = timestamp
+        state[5] = 1.0
+        return x, y
+
+    te = timestamp - state[4]
+    if te <= 0:
+        te = 1e-6
+    state[4] = timestamp
+
+    # 过滤导数（速度）
+    d_alpha = te / (te + _INV_TWO_PI / d_cutoff)
+    edx = d_alpha * ((x - state[0]) / te) + (1 - d_alpha) * state[2]
+    edy = d_alpha * ((y - state[1]) / te) + (1 - d_alpha) * state[3]
+    state[2] = edx
+    state[3] = edy
+
+    # 根据速度动态调整截止频率并过滤值
+    alpha_x = te / (te + _INV_TWO_PI / (min_cutoff + beta * abs(edx)))
+    alpha_y = te / (te + _INV_TWO_PI / (min_cutoff + beta * abs(edy)))
+    state[0] = alpha_x * x + (1 - alpha_x) * state[0]
+    state[1] = alpha_y * y + (1 - alpha_y) * state[1]
+
+    return state[0], state[1]
+
+
+def _one_euro_series(
+    xs, ys, timestamps, state, min_cutoff, beta, d_cutoff, out_x, out_y
+):
+    """
+    依次对一串 (x, y, 时间戳) 样本执行 _one_euro_step，结果写入 out_x/out_y
+
+    安装 numba 时与 _one_euro_step 一起编译，整个递推在本地代码中完成。
+    """
+    for i in range(len(xs)):
+        sx, sy = _one_euro_step_impl(
+            xs[i], ys[i], timestamps[i], state, min_cutoff, beta, d_cutoff
+        )
+        out_x[i] = sx
+        out_y[i] = sy
+
+
+# numba 可用时使用编译版本；纯 Python 下逐元素访问 numpy 数组很慢，状态改用列表
+if HAS_NUMBA:
+    _one_euro_step_impl = njit(cache=True)(_one_euro_step)
+    _one_euro_series_impl = njit(cache=True)(_one_euro_series)
+
+    def _new_euro_state():
+        return np.zeros(6, dtype=np.float64)
+
+else:
+    _one_euro_step_impl = _one_euro_step
+    _one_euro_series_impl = _one_euro_series
+
+    def _new_euro_state():
+        return [0.0] * 6
+
+
 class Smoother:
     """
     坐标平滑器
@@ -237,6 +345,24 @@ class Smoother:
     对 (x, y) 坐标进行平滑处理，支持多种预设模式。
     """
 
+    __slots__ = (
+        "enabled",
+        "_preset",
+        "_params",
+        "_euro_state",
+        "_batch_prev",
+        "_batch_dprev",
+        "_batch_time",
+        "_jitter_threshold",
+        "_jitter_threshold_sq",
+        "_last_x",
+        "_last_y",
+        "_jitter_count",
+        "_extra_active",
+        "_extra_x",
+        "_extra_y",
+    )
+
     def __init__(
         self,
         preset: SmoothingPreset = SmoothingPreset.BALANCED,
@@ -261,15 +387,27 @@ class Smoother:
             params = SmoothingParams.from_preset(preset)
 
         self._params = params
-        self._x_filter = OneEuroFilter(params.min_cutoff, params.beta, params.d_cutoff)
-        self._y_filter = OneEuroFilter(params.min_cutoff, params.beta, params.d_cutoff)
+
+        # x/y 融合的 One Euro 滤波状态，见 _one_euro_step
+        self._euro_state = _new_euro_state()
+
+        # 批量平滑状态，见 smooth_batch
+        self._batch_prev: Optional[np.ndarray] = None
+        self._batch_dprev: Optional[np.ndarray] = None
+        self._batch_time = 0.0
 
         # 抖动检测
         self._jitter_threshold = 0.002  # 小于此值视为抖动
+        self._jitter_threshold_sq = self._jitter_threshold**2
         self._last_x: Optional[float] = None
         self._last_y: Optional[float] = None
         self._jitter_count = 0
 
+        # 持续抖动时的额外平滑状态
+        self._extra_active = False
+        self._extra_x = 0.0
+        self._extra_y = 0.0
+
     def smooth(
         self,
         x: float,
@@ -295,11 +433,11 @@ class Smoother:
 
         # 抖动检测：如果移动很小，增加额外平滑
         if self._last_x is not None and self._last_y is not None:
-            dx = abs(x - self._last_x)
-            dy = abs(y - self._last_y)
-            movement = math.sqrt(dx * dx + dy * dy)
+            # 比较移动距离的平方，省去开方
+            dx = x - self._last_x
+            dy = y - self._last_y
 
-            if movement < self._jitter_threshold:
+            if dx * dx + dy * dy < self._jitter_threshold_sq:
                 self._jitter_count = min(self._jitter_count + 1, 10)
             else:
                 self._jitter_count = max(self._jitter_count - 2, 0)
@@ -308,38 +446,155 @@ class Smoother:
         self._last_y = y
 
         # 应用滤波
-        filtered_x = self._x_filter.filter(x, timestamp)
-        filtered_y = self._y_filter.filter(y, timestamp)
+        params = self._params
+        filtered_x, filtered_y = _one_euro_step_impl(
+            x,
+            y,
+            timestamp,
+            self._euro_state,
+            params.min_cutoff,
+            params.beta,
+            params.d_cutoff,
+        )
 
         # 如果检测到持续抖动，额外平滑
         if self._jitter_count > 5:
             # 使用更强的低通滤波
             alpha = 0.3
-            if hasattr(self, "_extra_x"):
+            if self._extra_active:
                 self._extra_x = alpha * filtered_x + (1 - alpha) * self._extra_x
                 self._extra_y = alpha * filtered_y + (1 - alpha) * self._extra_y
             else:
                 self._extra_x = filtered_x
                 self._extra_y = filtered_y
+                self._extra_active = True
             return self._extra_x, self._extra_y
 
         # 清除额外平滑状态
-        if hasattr(self, "_extra_x"):
-            del self._extra_x
-            del self._extra_y
+        self._extra_active = False
 
         return filtered_x, filtered_y
 
+    def smooth_batch(
+        self,
+        points: np.ndarray,
+        timestamp: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        批量平滑多个点（如全部 21 个关键点）
+
+        每个点的每个坐标独立做 One Euro 滤波，结果与逐个使用 OneEuroFilter 一致，
+        但整批只做一次 numpy 运算。不做抖动检测；点数变化时重新开始。
+
+        Args:
+            points: 形状为 (N, 2) 的坐标数组 (0-1)
+            timestamp: 时间戳
+
+        Returns:
+            平滑后的 (N, 2) 数组
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if not self.enabled:
+            return points
+
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        prev = self._batch_prev
+        if prev is None or prev.shape != points.shape:
+            # 第一次调用，直接返回
+            self._batch_prev = points.copy()
+            self._batch_dprev = np.zeros_like(points)
+            self._batch_time = timestamp
+            return points.copy()
+
+        te = timestamp - self._batch_time
+        if te <= 0:
+            te = 1e-6
+        self._batch_time = timestamp
+
+        params = self._params
+        dprev = self._batch_dprev
+
+        # 过滤导数（速度）
+        d_alpha = te / (te + _INV_TWO_PI / params.d_cutoff)
+        dprev += d_alpha * ((points - prev) / te - dprev)
+
+        # 根据速度动态调整截止频率并过滤值
+        cutoff = params.min_cutoff + params.beta * np.abs(dprev)
+        alpha = te / (te + _INV_TWO_PI / cutoff)
+        prev += alpha * (points - prev)
+
+        return prev.copy()
+
+    def smooth_series(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        按时间顺序平滑一串坐标（如回放录制的轨迹、离线调参）
+
+        与逐个调用 smooth() 共用滤波状态，结果与逐个调用一致，但不做抖动检测。
+
+        Args:
+            xs: X 坐标序列 (0-1)
+            ys: Y 坐标序列 (0-1)
+            timestamps: 对应的时间戳序列
+
+        Returns:
+            平滑后的 (xs, ys)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if not self.enabled:
+            return xs, ys
+
+        params = self._params
+        n = len(xs)
+        if HAS_NUMBA:
+            out_x = np.empty(n)
+            out_y = np.empty(n)
+            _one_euro_series_impl(
+                xs,
+                ys,
+                timestamps,
+                self._euro_state,
+                params.min_cutoff,
+                params.beta,
+                params.d_cutoff,
+                out_x,
+                out_y,
+            )
+            return out_x, out_y
+
+        out_x = [0.0] * n
+        out_y = [0.0] * n
+        _one_euro_series_impl(
+            xs.tolist(),
+            ys.tolist(),
+            timestamps.tolist(),
+            self._euro_state,
+            params.min_cutoff,
+            params.beta,
+            params.d_cutoff,
+            out_x,
+            out_y,
+        )
+        return np.array(out_x), np.array(out_y)
+
     def reset(self):
         """重置平滑器状态"""
-        self._x_filter.reset()
-        self._y_filter.reset()
+        # 清除初始化标志，下一个值直接通过
+        self._euro_state[5] = 0.0
+        self._batch_prev = None
+        self._batch_dprev = None
         self._last_x = None
         self._last_y = None
         self._jitter_count = 0
-        if hasattr(self, "_extra_x"):
-            del self._extra_x
-            del self._extra_y
+        self._extra_active = False
 
     def set_preset(self, preset: SmoothingPreset):
         """设置预设模式"""
@@ -362,14 +617,10 @@ class Smoother:
         """直接设置滤波器参数"""
         self._preset = SmoothingPreset.CUSTOM
         self._params = SmoothingParams(min_cutoff, beta, d_cutoff)
-        self._x_filter.set_params(min_cutoff, beta, d_cutoff)
-        self._y_filter.set_params(min_cutoff, beta, d_cutoff)
 
     def _apply_params(self, params: SmoothingParams):
         """应用参数到滤波器"""
         self._params = params
-        self._x_filter.set_params(params.min_cutoff, params.beta, params.d_cutoff)
-        self._y_filter.set_params(params.min_cutoff, params.beta, params.d_cutoff)
 
     @property
     def preset(self) -> SmoothingPreset:
@@ -389,9 +640,7 @@ class Smoother:
     @min_cutoff.setter
     def min_cutoff(self, value: float):
         """设置最小截止频率"""
-        self._params.min_cutoff = value
-        self._x_filter.min_cutoff = value
-        self._y_filter.min_cutoff = value
+        self._params = replace(self._params, min_cutoff=value)
 
     @property
     def beta(self) -> float:
@@ -401,6 +650,4 @@ class Smoother:
     @beta.setter
     def beta(self, value: float):
         """设置速度系数"""
-        self._params.beta = value
-        self._x_filter.beta = value
-        self._y_filter.beta = value
+        self._params = replace(self._params, beta=value)
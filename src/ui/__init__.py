@@ -1,7 +1,18 @@
 """用户界面模块"""
 
-from .settings_window import SettingsWindow
-from .tray import SystemTray
 from .visualizer import Visualizer
 
 __all__ = ["Visualizer", "SystemTray", "SettingsWindow"]
+
+
+def __getattr__(name: str):
+    # 设置窗口依赖 Tkinter，托盘依赖 pystray/PIL，按需导入以加快启动
+    if name == "SettingsWindow":
+        from .settings_window import SettingsWindow
+
+        return SettingsWindow
+    if name == "SystemTray":
+        from .tray import SystemTray
+
+        return SystemTray
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,6 +15,14 @@ import numpy as np
 from ..gestures.gestures import Gesture, GestureType
 from ..utils.i18n import get_i18n, t
 
+# cv2.pollKey (OpenCV >= 4.5) 只处理已有的窗口事件，不像 waitKey(1) 至少阻塞 1ms
+if hasattr(cv2, "pollKey"):
+    _poll_key = cv2.pollKey
+else:
+
+    def _poll_key() -> int:
+        return cv2.waitKey(1)
+
 
 class Visualizer:
     """可视化窗口 - 现代化 UI"""
@@ -92,6 +100,7 @@ class Visualizer:
         self.show_fps = show_fps
 
         self._window_created = False
+        self._mouse_callback = None
         self._fps_counter = FPSCounter()
         self._is_paused = False
 
@@ -121,6 +130,9 @@ class Visualizer:
             cv2.namedWindow(self.WINDOW_NAME, flags)
             cv2.resizeWindow(self.WINDOW_NAME, 960, 720)
             self._window_created = True
+            # 窗口重新创建后恢复鼠标回调
+            if self._mouse_callback is not None:
+                cv2.setMouseCallback(self.WINDOW_NAME, self._mouse_callback)
 
     def destroy_window(self):
         """销毁窗口"""
@@ -138,6 +150,7 @@ class Visualizer:
         gesture: Optional[Gesture] = None,
         control_zone: Optional[Tuple[int, int, int, int]] = None,
         cursor_pos: Optional[Tuple[int, int]] = None,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         渲染可视化界面
@@ -147,11 +160,18 @@ class Visualizer:
             gesture: 当前手势
             control_zone: 控制区域 (x1, y1, x2, y2)
             cursor_pos: 指针位置
+            out: 输出缓冲区（与 frame 同尺寸），传入 frame 本身表示原地绘制；
+                为 None 时复制一份新画面
 
         Returns:
             渲染后的画面
         """
-        display = frame.copy()
+        if out is None:
+            display = frame.copy()
+        else:
+            if out is not frame:
+                np.copyto(out, frame)
+            display = out
         h, w = display.shape[:2]
 
         # 检查尺寸变化
@@ -187,6 +207,15 @@ class Visualizer:
 
         return display
 
+    def _get_background(self, h: int, w: int) -> np.ndarray:
+        """获取整帧大小的纯背景色图像（缓存，用于半透明混合）"""
+        cache_key = f"bg_{w}_{h}"
+        bg = self._overlay_cache.get(cache_key)
+        if bg is None:
+            bg = np.full((h, w, 3), self.COLORS["bg_dark"], dtype=np.uint8)
+            self._overlay_cache[cache_key] = bg
+        return bg
+
     def _draw_rounded_rect(
         self,
         frame: np.ndarray,
@@ -311,13 +340,31 @@ class Visualizer:
         """绘制毛玻璃效果面板"""
         x1, y1 = pt1
         x2, y2 = pt2
+        h, w = frame.shape[:2]
 
-        # 创建遮罩
-        overlay = frame.copy()
-        self._draw_rounded_rect(overlay, pt1, pt2, self.COLORS["bg_dark"], radius)
+        # 只在面板所在区域（含抗锯齿边缘）内混合，避免整帧复制
+        rx1, ry1 = max(x1 - 2, 0), max(y1 - 2, 0)
+        rx2, ry2 = min(x2 + 3, w), min(y2 + 3, h)
+        if rx1 < rx2 and ry1 < ry2:
+            roi = frame[ry1:ry2, rx1:rx2]
+
+            # 创建遮罩（复用同尺寸的缓冲区）
+            cache_key = f"glass_{ry2 - ry1}_{rx2 - rx1}"
+            overlay = self._overlay_cache.get(cache_key)
+            if overlay is None:
+                overlay = np.empty_like(roi)
+                self._overlay_cache[cache_key] = overlay
+            np.copyto(overlay, roi)
+            self._draw_rounded_rect(
+                overlay,
+                (x1 - rx1, y1 - ry1),
+                (x2 - rx1, y2 - ry1),
+                self.COLORS["bg_dark"],
+                radius,
+            )
 
-        # 混合
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+            # 混合
+            cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, roi)
 
         # 边框高光（顶部）
         cv2.line(
@@ -340,22 +387,17 @@ class Visualizer:
         h, w = frame.shape[:2]
         x1, y1, x2, y2 = control_zone
 
-        # 缓存遮罩
-        cache_key = f"zone_{w}_{h}_{x1}_{y1}_{x2}_{y2}"
-        if cache_key not in self._overlay_cache:
-            mask = np.zeros((h, w), dtype=np.uint8)
-            mask[:y1, :] = 1
-            mask[y2:, :] = 1
-            mask[y1:y2, :x1] = 1
-            mask[y1:y2, x2:] = 1
-            self._overlay_cache[cache_key] = mask
-
-        mask = self._overlay_cache[cache_key]
-
-        # 暗化区域外
-        frame[mask == 1] = (
-            frame[mask == 1] * 0.3 + np.array(self.COLORS["bg_dark"]) * 0.7
-        ).astype(np.uint8)
+        # 暗化区域外（上、下、左、右四个条带分别与背景色混合）
+        bg = self._get_background(h, w)
+        for rows, cols in (
+            (slice(0, max(y1, 0)), slice(0, w)),
+            (slice(max(y2, 0), h), slice(0, w)),
+            (slice(max(y1, 0), max(y2, 0)), slice(0, max(x1, 0))),
+            (slice(max(y1, 0), max(y2, 0)), slice(max(x2, 0), w)),
+        ):
+            band = frame[rows, cols]
+            if band.size:
+                cv2.addWeighted(band, 0.3, bg[rows, cols], 0.7, 0, band)
 
         # 发光边框
         glow_intensity = 0.5 + 0.2 * math.sin(self._pulse_phase)
@@ -865,9 +907,7 @@ class Visualizer:
         h, w = frame.shape[:2]
 
         # 半透明覆盖
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, h), self.COLORS["bg_dark"], -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        cv2.addWeighted(self._get_background(h, w), 0.7, frame, 0.3, 0, frame)
 
         # 中心面板
         panel_w, panel_h = 240, 140
@@ -940,9 +980,7 @@ class Visualizer:
         h, w = frame.shape[:2]
 
         # 半透明背景
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, h), self.COLORS["bg_dark"], -1)
-        cv2.addWeighted(overlay, 0.85, frame, 0.15, 0, frame)
+        cv2.addWeighted(self._get_background(h, w), 0.85, frame, 0.15, 0, frame)
 
         # 教程面板
         panel_w, panel_h = min(500, w - 40), min(400, h - 40)
@@ -1110,7 +1148,28 @@ class Visualizer:
             self.create_window()
 
         cv2.imshow(self.WINDOW_NAME, frame)
-        return cv2.waitKey(1) & 0xFF
+        return _poll_key() & 0xFF
+
+    def is_window_hidden(self) -> bool:
+        """
+        窗口已创建但不可见（被最小化）
+
+        窗口被用户关闭（已销毁）时重置窗口状态并返回 False，下次显示时重新创建。
+        """
+        if not self._window_created:
+            return False
+        try:
+            visible = cv2.getWindowProperty(self.WINDOW_NAME, cv2.WND_PROP_VISIBLE)
+        except cv2.error:
+            return False
+        if visible < 0:
+            self.destroy_window()
+            return False
+        return visible < 1
+
+    def poll_key(self) -> int:
+        """只处理窗口事件和按键，不刷新画面"""
+        return _poll_key() & 0xFF
 
     def set_paused(self, paused: bool):
         """设置暂停状态"""
@@ -1118,9 +1177,11 @@ class Visualizer:
 
     def set_mouse_callback(self, callback):
         """设置鼠标回调"""
+        self._mouse_callback = callback
         if not self._window_created:
             self.create_window()
-        cv2.setMouseCallback(self.WINDOW_NAME, callback)
+        else:
+            cv2.setMouseCallback(self.WINDOW_NAME, callback)
 
     def check_click(self, x: int, y: int, frame_width: int) -> Optional[str]:
         """检查点击位置"""
@@ -4,6 +4,7 @@ LyraPointer 国际化 (i18n) 模块
 提供多语言支持，包括语言切换和翻译功能。
 """
 
+import functools
 import json
 import os
 from dataclasses import dataclass
@@ -643,28 +644,7 @@ class I18n:
         Returns:
             检测到的语言
         """
-        import locale
-
-        try:
-            # 获取系统语言设置
-            lang_code = locale.getdefaultlocale()[0]
-
-            if lang_code:
-                lang_code = lang_code.lower()
-
-                # 匹配语言
-                if lang_code.startswith("zh_cn") or lang_code == "zh":
-                    return Language.ZH_CN
-                elif lang_code.startswith("zh_tw") or lang_code.startswith("zh_hk"):
-                    return Language.ZH_TW
-                elif lang_code.startswith("ja"):
-                    return Language.JA
-                elif lang_code.startswith("ko"):
-                    return Language.KO
-        except Exception:
-            pass
-
-        return Language.EN
+        return _detect_system_language()
 
     def auto_detect_and_set(self):
         """自动检测并设置系统语言"""
@@ -672,6 +652,33 @@ class I18n:
         self.set_language(detected)
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_system_language() -> Language:
+    """检测系统语言（进程内只检测一次）"""
+    import locale
+
+    try:
+        # 获取系统语言设置
+        lang_code = locale.getdefaultlocale()[0]
+
+        if lang_code:
+            lang_code = lang_code.lower()
+
+            # 匹配语言
+            if lang_code.startswith("zh_cn") or lang_code == "zh":
+                return Language.ZH_CN
+            elif lang_code.startswith("zh_tw") or lang_code.startswith("zh_hk"):
+                return Language.ZH_TW
+            elif lang_code.startswith("ja"):
+                return Language.JA
+            elif lang_code.startswith("ko"):
+                return Language.KO
+    except Exception:
+        pass
+
+    return Language.EN
+
+
 # 全局 i18n 实例
 _global_i18n: Optional[I18n] = None
 
@@ -0,0 +1,156 @@
+"""
+LyraPointer 摄像头采集线程单元测试
+
+使用模拟摄像头测试 CaptureThread 的取帧与停止行为。
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.tracker.capture import CaptureThread
+
+
+class FakeCapture:
+    """模拟 cv2.VideoCapture，每次 grab 生成一帧递增像素值的图像"""
+
+    def __init__(self, max_frames: int = 1000, fail_retrieve: bool = False):
+        self.max_frames = max_frames
+        self.fail_retrieve = fail_retrieve
+        self.grabbed = 0
+        self.retrieved = 0
+        self.gate = threading.Semaphore(0)
+
+    def grab(self) -> bool:
+        # 每次 grab 需要测试显式放行，使帧序可控
+        if not self.gate.acquire(timeout=2.0):
+            return False
+        if self.grabbed >= self.max_frames:
+            return False
+        self.grabbed += 1
+        return True
+
+    def retrieve(self, image=None):
+        if self.fail_retrieve:
+            return False, None
+        self.retrieved += 1
+        if image is None:
+            image = np.empty((4, 4, 3), dtype=np.uint8)
+        image[:] = self.grabbed % 256
+        return True, image
+
+
+@pytest.fixture
+def fake_cap():
+    return FakeCapture()
+
+
+class TestCaptureThread:
+    """测试采集线程"""
+
+    def test_read_returns_latest_frame(self, fake_cap):
+        """read 返回最新一帧"""
+        capture = CaptureThread(fake_cap)
+        capture.start()
+        try:
+            fake_cap.gate.release()
+            ret, frame = capture.read(timeout=2.0)
+            assert ret
+            assert frame.shape == (4, 4, 3)
+            assert frame[0, 0, 0] == 1
+        finally:
+            fake_cap.gate.release()
+            capture.stop()
+
+    def test_read_returns_copy(self, fake_cap):
+        """read 返回副本，后续采集不会修改已取出的帧"""
+        capture = CaptureThread(fake_cap)
+        capture.start()
+        try:
+            fake_cap.gate.release()
+            _, first = capture.read(timeout=2.0)
+            for _ in range(3):
+                fake_cap.gate.release()
+                capture.read(timeout=2.0)
+            assert first[0, 0, 0] == 1
+        finally:
+            fake_cap.gate.release()
+            capture.stop()
+
+    def test_decode_interval_skips_retrieve(self, fake_cap):
+        """decode_interval > 1 时被跳过的帧只 grab 不解码"""
+        capture = CaptureThread(fake_cap, decode_interval=3)
+        capture.start()
+        try:
+            for _ in range(3):
+                fake_cap.gate.release()
+            ret, frame = capture.read(timeout=2.0)
+            assert ret
+            assert frame[0, 0, 0] == 3
+            assert fake_cap.grabbed == 3
+            assert fake_cap.retrieved == 1
+        finally:
+            fake_cap.gate.release()
+            capture.stop()
+
+    def test_read_timeout(self, fake_cap):
+        """没有新帧时超时返回 (True, None)"""
+        capture = CaptureThread(fake_cap)
+        capture.start()
+        try:
+            ret, frame = capture.read(timeout=0.05)
+            assert ret
+            assert frame is None
+        finally:
+            fake_cap.gate.release()
+            capture.stop()
+
+    def test_grab_failure_ends_capture(self):
+        """grab 失败后 read 返回失败"""
+        cap = FakeCapture(max_frames=0)
+        capture = CaptureThread(cap)
+        capture.start()
+        cap.gate.release()
+        ret, frame = capture.read(timeout=2.0)
+        assert not ret
+        assert frame is None
+        capture.stop()
+        assert not capture.is_running
+
+    def test_retrieve_failure_ends_capture(self):
+        """retrieve 失败后 read 返回失败"""
+        cap = FakeCapture(fail_retrieve=True)
+        capture = CaptureThread(cap)
+        capture.start()
+        cap.gate.release()
+        ret, _ = capture.read(timeout=2.0)
+        assert not ret
+        capture.stop()
+
+    def test_stop_wakes_reader(self, fake_cap):
+        """stop 会唤醒等待中的 read"""
+        capture = CaptureThread(fake_cap)
+        capture.start()
+        fake_cap.gate.release()
+        capture.read(timeout=2.0)
+
+        result = []
+        reader = threading.Thread(
+            target=lambda: result.append(capture.read(timeout=5.0))
+        )
+        reader.start()
+        fake_cap.gate.release()
+        capture.stop()
+        reader.join(2.0)
+        assert not reader.is_alive()
+
+    def test_stop_reports_blocked_thread(self, fake_cap):
+        """采集线程阻塞在 grab 中时 stop 超时返回 False"""
+        capture = CaptureThread(fake_cap)
+        capture.start()
+        assert not capture.stop(timeout=0.05)
+
+        # grab 返回后线程退出
+        fake_cap.gate.release()
+        assert capture.stop(timeout=2.0)
@@ -0,0 +1,135 @@
+"""
+LyraPointer 鼠标移动输出线程单元测试
+
+使用模拟鼠标测试 CursorMover 的插值、跳转、重置与停止行为。
+"""
+
+import threading
+import time
+
+import pytest
+
+# src.control 包在导入时会加载 pyautogui
+pytest.importorskip("pyautogui")
+
+from src.control.cursor_mover import CursorMover
+
+
+class FakeMouse:
+    """模拟鼠标控制器，记录每次移动"""
+
+    def __init__(self):
+        self.moves = []
+        self._lock = threading.Lock()
+
+    def move_to(self, x: int, y: int):
+        with self._lock:
+            self.moves.append((x, y))
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return list(self.moves)
+
+
+def wait_for_move(mouse: FakeMouse, pos: tuple, timeout: float = 1.0) -> bool:
+    """等待鼠标移动到指定位置"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        moves = mouse.snapshot()
+        if moves and moves[-1] == pos:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.fixture
+def mouse():
+    return FakeMouse()
+
+
+@pytest.fixture
+def mover(mouse):
+    mover = CursorMover(mouse, rate_hz=200)
+    mover.start()
+    yield mover
+    mover.stop()
+
+
+class TestCursorMover:
+    """测试鼠标移动输出线程"""
+
+    def test_first_target_is_direct(self, mouse, mover):
+        """第一个目标点直接到达，不插值"""
+        mover.set_target(100, 200)
+        assert wait_for_move(mouse, (100, 200))
+        assert mouse.snapshot() == [(100, 200)]
+
+    def test_set_target_interpolates(self, mouse, mover):
+        """相邻目标点之间线性插值"""
+        mover.set_target(0, 0)
+        assert wait_for_move(mouse, (0, 0))
+        time.sleep(0.05)
+
+        mover.set_target(100, 0)
+        assert wait_for_move(mouse, (100, 0))
+
+        xs = [x for x, _ in mouse.snapshot()[1:]]
+        # 中间经过若干插值点，并且单调向目标移动
+        assert len(xs) > 2
+        assert all(0 < x <= 100 for x in xs)
+        assert xs == sorted(xs)
+
+    def test_jump_to_ends_segment(self, mouse, mover):
+        """jump_to 立即移动并结束当前插值"""
+        mover.set_target(0, 0)
+        assert wait_for_move(mouse, (0, 0))
+        time.sleep(0.05)
+
+        mover.set_target(1000, 0)
+        mover.jump_to(500, 500)
+        # jump_to 在调用线程中同步移动
+        assert mouse.snapshot()[-1] == (500, 500)
+
+        time.sleep(0.15)
+        moves = mouse.snapshot()
+        assert moves[-1] == (500, 500)
+        assert (1000, 0) not in moves
+
+    def test_reset_makes_next_target_direct(self, mouse, mover):
+        """reset 后下一个目标点直接到达"""
+        mover.set_target(0, 0)
+        assert wait_for_move(mouse, (0, 0))
+        time.sleep(0.05)
+
+        mover.reset()
+        count = len(mouse.snapshot())
+        mover.set_target(300, 300)
+        assert wait_for_move(mouse, (300, 300))
+        assert mouse.snapshot()[count:] == [(300, 300)]
+
+    def test_without_interpolation(self, mouse):
+        """interpolate=False 时直接移动到最新目标点"""
+        mover = CursorMover(mouse, rate_hz=200, interpolate=False)
+        mover.start()
+        try:
+            mover.set_target(0, 0)
+            assert wait_for_move(mouse, (0, 0))
+            time.sleep(0.05)
+            mover.set_target(100, 0)
+            assert wait_for_move(mouse, (100, 0))
+            assert mouse.snapshot() == [(0, 0), (100, 0)]
+        finally:
+            mover.stop()
+
+    def test_stop(self, mouse, mover):
+        """stop 结束输出线程，之后不再移动"""
+        mover.set_target(10, 10)
+        assert wait_for_move(mouse, (10, 10))
+
+        mover.stop()
+        assert not mover.is_running
+
+        count = len(mouse.snapshot())
+        mover.set_target(20, 20)
+        time.sleep(0.05)
+        assert len(mouse.snapshot()) == count
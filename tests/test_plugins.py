@@ -0,0 +1,275 @@
+"""
+LyraPointer 插件系统单元测试
+
+测试插件配置验证与插件管理器。
+"""
+
+import sys
+
+import pytest
+
+# conftest.py 已经设置了正确的导入路径
+from src.gestures.gestures import Gesture, GestureType
+from src.plugins.base import ActionPlugin, PluginInfo, PluginType
+from src.plugins.manager import PluginManager
+
+
+class CountingActionPlugin(ActionPlugin):
+    """记录 info 访问次数的动作插件"""
+
+    info_calls = 0
+
+    @property
+    def info(self) -> PluginInfo:
+        type(self).info_calls += 1
+        return PluginInfo(
+            name="Counting",
+            plugin_type=PluginType.ACTION,
+            config_schema={
+                "speed": {"type": int, "required": True, "min": 1, "max": 10},
+                "label": {"type": str},
+            },
+        )
+
+    def execute(self, gesture, context) -> bool:
+        return True
+
+
+class NoSchemaActionPlugin(ActionPlugin):
+    """没有配置项定义的动作插件"""
+
+    def execute(self, gesture, context) -> bool:
+        return True
+
+
+@pytest.fixture
+def plugin():
+    CountingActionPlugin.info_calls = 0
+    CountingActionPlugin._config_rules_cache = None
+    return CountingActionPlugin()
+
+
+class TestValidateConfig:
+    """测试插件配置验证"""
+
+    def test_valid_config(self, plugin):
+        """合法配置没有错误"""
+        assert plugin.validate_config({"speed": 5, "label": "a"}) == []
+
+    def test_missing_required(self, plugin):
+        """缺少必填项"""
+        errors = plugin.validate_config({})
+        assert errors == ["Missing required config: speed"]
+
+    def test_invalid_type(self, plugin):
+        """类型错误"""
+        errors = plugin.validate_config({"speed": 5, "label": 3})
+        assert errors == ["Invalid type for label: expected str, got int"]
+
+    def test_out_of_range(self, plugin):
+        """超出取值范围"""
+        assert plugin.validate_config({"speed": 0}) == ["speed must be >= 1"]
+        assert plugin.validate_config({"speed": 11}) == ["speed must be <= 10"]
+
+    def test_schema_read_once_per_class(self, plugin):
+        """配置项定义只读取一次，并由同类实例共用"""
+        plugin.validate_config({"speed": 5})
+        plugin.validate_config({"speed": 6})
+        CountingActionPlugin().validate_config({"speed": 7})
+        assert CountingActionPlugin.info_calls == 1
+
+    def test_schema_cache_not_shared_between_classes(self, plugin):
+        """不同插件类各自缓存配置项定义"""
+        plugin.validate_config({"speed": 5})
+        assert NoSchemaActionPlugin().validate_config({"speed": 5.5}) == []
+        assert plugin.validate_config({"speed": 5.5})
+
+
+class RecordingActionPlugin(ActionPlugin):
+    """记录执行次数的动作插件"""
+
+    def __init__(self, name, triggers=None, priority=0):
+        super().__init__()
+        self._info = PluginInfo(
+            name=name,
+            plugin_type=PluginType.ACTION,
+            priority=priority,
+            triggers=triggers,
+        )
+        self.executed = 0
+
+    @property
+    def info(self) -> PluginInfo:
+        return self._info
+
+    def execute(self, gesture, context) -> bool:
+        self.executed += 1
+        return True
+
+
+class VetoActionPlugin(RecordingActionPlugin):
+    """重写 can_execute 的动作插件"""
+
+    def can_execute(self, gesture, context) -> bool:
+        return context.get("allow", False)
+
+
+class TestActionDispatch:
+    """测试按手势类型分发动作插件"""
+
+    def test_triggers_filter_plugins(self):
+        """只分发给 triggers 包含该手势的插件"""
+        manager = PluginManager()
+        palm = RecordingActionPlugin("palm", frozenset({GestureType.PALM}))
+        any_gesture = RecordingActionPlugin("any")
+        manager.register(palm)
+        manager.register(any_gesture)
+
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 1
+        assert manager.execute_actions(Gesture(GestureType.PALM), {}) == 2
+        assert palm.executed == 1
+        assert any_gesture.executed == 2
+
+    def test_priority_order(self):
+        """按优先级排序"""
+        manager = PluginManager()
+        low = RecordingActionPlugin("low", priority=1)
+        high = RecordingActionPlugin("high", priority=5)
+        manager.register(low)
+        manager.register(high)
+
+        plugins = [p for p, _ in manager.get_action_plugins_for(GestureType.CLICK)]
+        assert plugins == [high, low]
+
+    def test_disable_invalidates_index(self):
+        """禁用/启用插件后重新筛选"""
+        manager = PluginManager()
+        plugin = RecordingActionPlugin("p")
+        manager.register(plugin)
+        assert manager.get_action_plugins_for(GestureType.CLICK)
+
+        manager.disable("p")
+        assert manager.get_action_plugins_for(GestureType.CLICK) == ()
+
+        manager.enable("p")
+        assert manager.get_action_plugins_for(GestureType.CLICK)
+
+    def test_unregister_invalidates_index(self):
+        """注销插件后不再分发"""
+        manager = PluginManager()
+        manager.register(RecordingActionPlugin("p"))
+        manager.get_action_plugins_for(GestureType.CLICK)
+        manager.unregister("p")
+        assert manager.get_action_plugins_for(GestureType.CLICK) == ()
+
+    def test_overridden_can_execute_is_called(self):
+        """重写了 can_execute 的插件仍会被检查"""
+        manager = PluginManager()
+        plugin = VetoActionPlugin("veto")
+        manager.register(plugin)
+
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 0
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {"allow": True}) == 1
+
+    def test_get_by_type_priority_then_register_order(self):
+        """按类型获取时按优先级排序，同优先级保持注册顺序"""
+        manager = PluginManager()
+        a = RecordingActionPlugin("a", priority=1)
+        b = RecordingActionPlugin("b", priority=3)
+        c = RecordingActionPlugin("c", priority=1)
+        for plugin in (a, b, c):
+            manager.register(plugin)
+        assert manager.get_by_type(PluginType.ACTION) == [b, a, c]
+        assert manager.get_by_type(PluginType.GESTURE) == []
+
+        manager.unregister("b")
+        assert manager.get_action_plugins() == (a, c)
+
+    def test_toggle_enabled_through_property(self):
+        """直接修改 plugin.enabled 也会生效"""
+        manager = PluginManager()
+        plugin = RecordingActionPlugin("p")
+        manager.register(plugin)
+        assert manager.get_action_plugins() == (plugin,)
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 1
+
+        plugin.enabled = False
+        assert manager.get_action_plugins() == ()
+        assert manager.get_action_plugins_for(GestureType.CLICK) == ()
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 0
+
+        plugin.enabled = True
+        assert manager.get_action_plugins() == (plugin,)
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 1
+
+    def test_info_disabled_plugin_filtered(self):
+        """info.enabled 为 False 的插件不会被分发"""
+        manager = PluginManager()
+        plugin = RecordingActionPlugin("p")
+        manager.register(plugin)
+        manager.get_action_plugins_for(GestureType.CLICK)
+
+        plugin._info.enabled = False
+        assert manager.get_action_plugins() == ()
+        assert manager.execute_actions(Gesture(GestureType.CLICK), {}) == 0
+
+    def test_unmet_dependencies_rejected(self):
+        """依赖未注册时拒绝注册"""
+        manager = PluginManager()
+        plugin = RecordingActionPlugin("child")
+        plugin._info.dependencies = ["parent"]
+        assert not manager.register(plugin)
+
+        manager.register(RecordingActionPlugin("parent"))
+        assert manager.register(plugin)
+
+
+PLUGIN_SOURCE = """
+from src.plugins.base import ActionPlugin, PluginInfo, PluginType
+
+
+class Alpha(ActionPlugin):
+    @property
+    def info(self):
+        return PluginInfo(name="alpha", plugin_type=PluginType.ACTION)
+
+    def execute(self, gesture, context):
+        return True
+
+
+class Beta(Alpha):
+    @property
+    def info(self):
+        return PluginInfo(name="beta", plugin_type=PluginType.ACTION)
+"""
+
+
+class TestLoadFromFile:
+    """测试从文件加载插件"""
+
+    def test_first_plugin_class_without_declaration(self, tmp_path):
+        """未声明 __plugin__ 时取第一个插件子类"""
+        path = tmp_path / "scan_plugin.py"
+        path.write_text(PLUGIN_SOURCE)
+        plugin = PluginManager().load_from_file(path)
+        assert plugin.name == "alpha"
+
+    def test_declared_plugin_class(self, tmp_path):
+        """优先使用模块声明的 __plugin__"""
+        path = tmp_path / "declared_plugin.py"
+        path.write_text(PLUGIN_SOURCE + "\n__plugin__ = Beta\n")
+        plugin = PluginManager().load_from_file(path)
+        assert plugin.name == "beta"
+
+    def test_invalid_declaration(self, tmp_path):
+        """__plugin__ 不是插件类时加载失败"""
+        path = tmp_path / "invalid_plugin.py"
+        path.write_text(PLUGIN_SOURCE + "\n__plugin__ = object\n")
+        assert PluginManager().load_from_file(path) is None
+
+    def test_failed_load_leaves_no_module(self, tmp_path):
+        """模块执行失败时不残留在 sys.modules 中"""
+        path = tmp_path / "broken_plugin.py"
+        path.write_text("raise RuntimeError('boom')\n")
+        assert PluginManager().load_from_file(path) is None
+        assert "lyrapointer_plugin_broken_plugin" not in sys.modules
@@ -0,0 +1,534 @@
+"""
+LyraPointer 手势录制器单元测试
+
+测试录制数据结构、帧查找、序列化和回放。
+"""
+
+import asyncio
+import bisect
+import json
+import random
+import threading
+import time
+
+import pytest
+
+# conftest.py 已经设置了正确的导入路径
+from src.gestures.gestures import Gesture, GestureType
+from src.gestures.recorder import (
+    GestureFrame,
+    GestureRecorder,
+    GestureRecording,
+    RecordingManager,
+    RecordingState,
+    _interpolation_search,
+)
+
+
+def make_recording(timestamps) -> GestureRecording:
+    """按给定时间戳构建录制"""
+    return GestureRecording(
+        name="Test",
+        frames=[GestureFrame(timestamp=t, gesture_type="POINTER") for t in timestamps],
+    )
+
+
+class TestGetFrameAt:
+    """测试按时间查找帧"""
+
+    def test_empty_recording(self):
+        """空录制应返回 None"""
+        assert GestureRecording().get_frame_at(1.0) is None
+
+    def test_before_first_frame(self):
+        """早于第一帧时应返回 None"""
+        recording = make_recording([0.5, 1.0])
+        assert recording.get_frame_at(0.1) is None
+
+    @pytest.mark.parametrize(
+        "offset,expected",
+        [
+            (0.0, 0.0),
+            (0.05, 0.0),
+            (0.1, 0.1),
+            (0.15, 0.1),
+            (0.3, 0.3),
+            (99.0, 0.3),
+        ],
+    )
+    def test_returns_last_frame_not_after_offset(self, offset, expected):
+        """应返回最后一个时间戳不晚于偏移量的帧"""
+        recording = make_recording([0.0, 0.1, 0.2, 0.3])
+        assert recording.get_frame_at(offset).timestamp == expected
+
+    def test_duplicate_timestamps(self):
+        """时间戳重复时应返回最后一个"""
+        recording = make_recording([0.0, 0.1, 0.1, 0.2])
+        assert recording.get_frame_at(0.1) is recording.frames[2]
+
+    def test_add_frame(self):
+        """add_frame 追加的帧应能被查找到"""
+        recording = make_recording([0.0])
+        recording.add_frame(GestureFrame(timestamp=0.5, gesture_type="CLICK"))
+
+        assert recording.get_frame_at(0.6).gesture_type == "CLICK"
+
+    def test_get_frames_at(self):
+        """批量查找应与逐个查找结果一致"""
+        recording = make_recording([0.0, 0.1, 0.2, 0.3])
+        offsets = [-1.0, 0.0, 0.15, 0.3, 5.0]
+
+        assert recording.get_frames_at(offsets) == [
+            recording.get_frame_at(offset) for offset in offsets
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_interpolation_search_matches_bisect(self, seed):
+        """插值查找结果应与二分查找一致（含重复和不均匀时间戳）"""
+        rng = random.Random(seed)
+        timestamps = sorted(round(rng.uniform(0, 10), 1) for _ in range(500))
+        offsets = timestamps + [rng.uniform(-1, 11) for _ in range(200)]
+
+        for offset in offsets:
+            expected = bisect.bisect_right(timestamps, offset) - 1
+            assert _interpolation_search(timestamps, offset) == expected
+
+    def test_frames_mutated_directly(self):
+        """直接修改 frames 列表后查找仍然正确"""
+        recording = make_recording([0.0])
+        recording.frames.append(GestureFrame(timestamp=0.5, gesture_type="CLICK"))
+
+        assert recording.get_frame_at(0.6).gesture_type == "CLICK"
+
+
+class TestSerialization:
+    """测试序列化"""
+
+    def test_dict_round_trip(self):
+        """to_dict / from_dict 应保持数据一致"""
+        recording = make_recording([0.0, 0.1])
+        recording.frames[1].position = (0.25, 0.75)
+        recording.frames[1].data = {"key": "value"}
+
+        restored = GestureRecording.from_dict(recording.to_dict())
+
+        assert restored.frame_count == 2
+        assert restored.frames[1].position == (0.25, 0.75)
+        assert restored.frames[1].data == {"key": "value"}
+        assert restored.get_frame_at(0.1) is restored.frames[1]
+
+    def test_save_and_load(self, tmp_path):
+        """保存后加载应保持数据一致"""
+        recording = make_recording([0.0, 0.1, 0.2])
+        recording.frames[0].screen_position = (100, 200)
+        path = tmp_path / "recording.json"
+
+        recording.save(path)
+        restored = GestureRecording.load(path)
+
+        assert restored.name == "Test"
+        assert restored.frame_count == 3
+        assert restored.frames[0].screen_position == (100, 200)
+
+    def test_binary_round_trip(self, tmp_path):
+        """二进制格式保存后加载应保持数据一致"""
+        recording = make_recording([0.0, 0.1, 0.2])
+        recording.description = "描述"
+        recording.metadata = {"source": "test"}
+        recording.frames[0].position = (0.123456789, 0.5)
+        recording.frames[1].screen_position = (1920, 1080)
+        recording.frames[1].gesture_type = "CLICK"
+        recording.frames[2].data = {"pinch": 0.03}
+        path = tmp_path / "recording.lyrec"
+
+        recording.save_binary(path)
+        restored = GestureRecording.load_binary(path)
+
+        assert restored.name == recording.name
+        assert restored.description == recording.description
+        assert restored.metadata == recording.metadata
+        assert restored.frames == recording.frames
+
+    def test_load_binary_rejects_json(self, tmp_path):
+        """加载非二进制录制文件应报错"""
+        path = tmp_path / "recording.json"
+        make_recording([0.0]).save(path)
+
+        with pytest.raises(ValueError):
+            GestureRecording.load_binary(path)
+
+    def test_load_header(self, tmp_path):
+        """只读取头部信息也应得到正确的帧数"""
+        recording = make_recording([i * 0.016 for i in range(1000)])
+        recording.duration = 16.0
+        path = tmp_path / "recording.json"
+        recording.save(path)
+
+        header = GestureRecording.load_header(path)
+
+        assert header["name"] == "Test"
+        assert header["duration"] == 16.0
+        assert header["frame_count"] == 1000
+
+    def test_load_header_legacy_format(self, tmp_path):
+        """旧格式文件（无 frame_count）应回退到完整加载"""
+        data = make_recording([0.0, 0.1]).to_dict()
+        del data["frame_count"]
+        path = tmp_path / "legacy.json"
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        assert GestureRecording.load_header(path)["frame_count"] == 2
+
+
+class TestRecordingManager:
+    """测试录制管理器"""
+
+    def test_list_and_info(self, tmp_path):
+        """列表与信息查询应返回头部信息"""
+        manager = RecordingManager(tmp_path)
+        manager.save_recording(make_recording([0.0, 0.1, 0.2]), "first")
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+        listing = manager.list_recordings()
+
+        assert [name for name, _ in listing] == ["first.json"]
+        assert listing[0][1]["frame_count"] == 3
+        assert manager.get_recording_info("first") == listing[0][1]
+        assert manager.get_recording_info("missing") is None
+
+    def test_info_refreshes_after_resave(self, tmp_path):
+        """录制文件被覆盖后信息应随之更新"""
+        manager = RecordingManager(tmp_path)
+        manager.save_recording(make_recording([0.0]), "clip")
+        assert manager.get_recording_info("clip")["frame_count"] == 1
+
+        manager.save_recording(make_recording([0.0, 0.1]), "clip")
+
+        assert manager.get_recording_info("clip")["frame_count"] == 2
+        assert manager.list_recordings()[0][1]["frame_count"] == 2
+
+
+class TestRecording:
+    """测试录制流程"""
+
+    @pytest.fixture
+    def recorder(self):
+        """创建不限帧率的录制器"""
+        recorder = GestureRecorder()
+        recorder.set_min_frame_interval(0.001)
+        return recorder
+
+    def test_record_frames(self, recorder):
+        """录制的帧应带有递增的相对时间戳"""
+        recorder.start_recording("Test")
+        for _ in range(3):
+            assert recorder.record_frame(Gesture(GestureType.POINTER), (0.5, 0.5))
+            time.sleep(0.002)
+        recording = recorder.stop_recording()
+
+        timestamps = [frame.timestamp for frame in recording.frames]
+        assert len(timestamps) == 3
+        assert timestamps == sorted(timestamps)
+        assert 0.0 <= timestamps[0] < timestamps[-1] <= recording.duration
+
+    def test_idle_gestures_skipped(self, recorder):
+        """默认不录制空闲手势"""
+        recorder.start_recording()
+
+        assert not recorder.record_frame(Gesture(GestureType.FIST))
+        assert not recorder.record_frame(Gesture(GestureType.NONE))
+
+    def test_frame_interval_limit(self):
+        """间隔过短的帧应被丢弃"""
+        recorder = GestureRecorder()
+        recorder.set_min_frame_interval(10.0)
+        recorder.start_recording()
+
+        assert recorder.record_frame(Gesture(GestureType.POINTER))
+        assert not recorder.record_frame(Gesture(GestureType.POINTER))
+
+    def test_pause_excluded_from_timestamps(self, recorder):
+        """暂停期间不计入录制时间"""
+        recorder.start_recording()
+        recorder.pause_recording()
+        time.sleep(0.05)
+        recorder.resume_recording()
+        recorder.record_frame(Gesture(GestureType.POINTER))
+
+        assert recorder.current_recording.frames[0].timestamp < 0.04
+
+    def test_frames_visible_during_recording(self, recorder):
+        """录制过程中也能读取已录制的帧"""
+        recorder.start_recording()
+        recorder.record_frame(Gesture(GestureType.POINTER), (0.1, 0.2))
+
+        frames = recorder.current_recording.frames
+        assert len(frames) == 1
+        assert frames[0].position == (0.1, 0.2)
+
+    def test_record_callback_receives_stored_frame(self, recorder):
+        """录制回调收到的帧应与录制中保存的帧一致"""
+        received = []
+        recorder.start_recording()
+        recorder.record_frame(Gesture(GestureType.POINTER))
+        time.sleep(0.002)
+        recorder.on_record(received.append)
+        recorder.record_frame(Gesture(GestureType.CLICK))
+        recording = recorder.stop_recording()
+
+        assert [f.gesture_type for f in recording.frames] == ["POINTER", "CLICK"]
+        assert received == [recording.frames[1]]
+        assert received[0] is recording.frames[1]
+
+    def test_not_recording(self, recorder):
+        """未开始录制时不应记录"""
+        assert not recorder.record_frame(Gesture(GestureType.POINTER))
+        assert recorder.stop_recording() is None
+
+
+class TestPlayback:
+    """测试回放"""
+
+    def test_plays_all_frames_in_order(self):
+        """回放应按顺序触发每一帧并报告进度"""
+        recorder = GestureRecorder()
+        recording = make_recording([0.0, 0.01, 0.02, 0.03])
+        played = []
+        done = threading.Event()
+
+        recorder.play(
+            recording,
+            speed=10.0,
+            on_frame=lambda frame, progress: played.append((frame, progress)),
+            on_complete=done.set,
+        )
+
+        assert done.wait(2.0)
+        assert [frame for frame, _ in played] == recording.frames
+        assert [progress for _, progress in played] == [0.25, 0.5, 0.75, 1.0]
+
+    def test_stop_interrupts_wait(self):
+        """停止回放应立即中断等待"""
+        recorder = GestureRecorder()
+        recording = make_recording([0.0, 5.0])
+        played = []
+
+        recorder.play(recording, on_frame=lambda f, p: played.append(f))
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        recorder.stop_playback()
+
+        assert time.monotonic() - start < 0.5
+        assert played == recording.frames[:1]
+        assert recorder.state == RecordingState.IDLE
+
+    def test_replaced_thread_stops_dispatching(self):
+        """被新回放取代的旧回放线程离开慢回调后不应再分发帧"""
+        recorder = GestureRecorder()
+        release = threading.Event()
+        first_played = []
+
+        def slow(frame, progress):
+            first_played.append(frame)
+            release.wait(2.0)
+
+        recorder.play(make_recording([0.0, 0.0]), on_frame=slow, loop=True)
+        time.sleep(0.05)
+
+        # 旧线程仍阻塞在回调中，stop_playback 的 join 会超时
+        done = threading.Event()
+        recorder.play(make_recording([0.0]), on_complete=done.set)
+        release.set()
+
+        assert done.wait(2.0)
+        time.sleep(0.05)
+        assert len(first_played) == 1
+
+    def test_play_async(self):
+        """异步回放应按顺序触发每一帧"""
+        recorder = GestureRecorder()
+        recording = make_recording([0.0, 0.01, 0.02])
+        played = []
+        states = []
+        recorder.on_state_change(states.append)
+
+        asyncio.run(
+            recorder.play_async(
+                recording, speed=10.0, on_frame=lambda f, p: played.append(p)
+            )
+        )
+
+        assert played == pytest.approx([1 / 3, 2 / 3, 1.0])
+        assert states == [RecordingState.PLAYING, RecordingState.IDLE]
+
+    def test_play_async_on_complete(self):
+        """异步回放自然结束时调用完成回调，被停止时不调用"""
+        recorder = GestureRecorder()
+        completed = []
+
+        asyncio.run(
+            recorder.play_async(
+                make_recording([0.0, 0.01]),
+                speed=10.0,
+                on_complete=lambda: completed.append("done"),
+            )
+        )
+        assert completed == ["done"]
+
+        async def run():
+            task = asyncio.create_task(
+                recorder.play_async(
+                    make_recording([0.0, 5.0]),
+                    on_complete=lambda: completed.append("stopped"),
+                )
+            )
+            await asyncio.sleep(0.05)
+            recorder.stop_playback()
+            await asyncio.wait_for(task, 0.5)
+
+        asyncio.run(run())
+
+        assert completed == ["done"]
+        assert recorder.state == RecordingState.IDLE
+
+    def test_play_async_cancel(self):
+        """取消异步回放任务应停止回放"""
+        recorder = GestureRecorder()
+        recording = make_recording([0.0, 5.0])
+        played = []
+
+        async def run():
+            task = asyncio.create_task(
+                recorder.play_async(recording, on_frame=lambda f, p: played.append(f))
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert played == recording.frames[:1]
+        assert recorder.state == RecordingState.IDLE
+
+    def test_play_async_overlapping_sessions(self):
+        """新的回放开始后，旧的异步回放应停止且不影响新回放"""
+        recorder = GestureRecorder()
+        first = make_recording([0.0, 5.0])
+        second = make_recording([0.0, 0.01, 0.02, 0.03])
+        first_played = []
+        second_progress = []
+
+        async def run():
+            task = asyncio.create_task(
+                recorder.play_async(first, on_frame=lambda f, p: first_played.append(f))
+            )
+            await asyncio.sleep(0.05)
+            await recorder.play_async(
+                second, speed=10.0, on_frame=lambda f, p: second_progress.append(p)
+            )
+            await asyncio.wait_for(task, 1.0)
+
+        asyncio.run(run())
+
+        assert first_played == first.frames[:1]
+        assert second_progress == [0.25, 0.5, 0.75, 1.0]
+        assert recorder.state == RecordingState.IDLE
+
+    def test_stop_playback_wakes_async(self):
+        """stop_playback 应立即唤醒等待中的异步回放"""
+        recorder = GestureRecorder()
+        recording = make_recording([0.0, 5.0])
+        played = []
+
+        async def run():
+            task = asyncio.create_task(
+                recorder.play_async(recording, on_frame=lambda f, p: played.append(f))
+            )
+            await asyncio.sleep(0.05)
+            recorder.stop_playback()
+            await asyncio.wait_for(task, 0.5)
+
+        asyncio.run(run())
+
+        assert played == recording.frames[:1]
+        assert recorder.state == RecordingState.IDLE
+
+
+class TestCallbacks:
+    """测试回调注册与分发"""
+
+    def test_rejects_non_callable(self):
+        """注册不可调用对象应立即报错"""
+        recorder = GestureRecorder()
+
+        with pytest.raises(TypeError):
+            recorder.on_record("not callable")
+        with pytest.raises(TypeError):
+            recorder.play(make_recording([0.0]), on_frame=42)
+
+    def test_callback_error_does_not_propagate(self):
+        """回调异常不应中断状态切换"""
+        recorder = GestureRecorder()
+
+        def failing(state):
+            raise RuntimeError("boom")
+
+        recorder.on_state_change(failing)
+        recorder.start_recording()
+
+        assert recorder.is_recording
+
+    def test_callback_error_does_not_skip_others(self):
+        """一个回调出错后仍应调用其余回调"""
+        recorder = GestureRecorder()
+        states = []
+
+        def failing(state):
+            raise RuntimeError("boom")
+
+        recorder.on_state_change(failing)
+        recorder.on_state_change(states.append)
+        recorder.on_state_change(failing)
+        recorder.on_state_change(states.append)
+        recorder.start_recording()
+
+        assert states == [RecordingState.RECORDING, RecordingState.RECORDING]
+
+    def test_restart_recording_notifies_once(self):
+        """重新开始录制时只通知最终状态"""
+        recorder = GestureRecorder()
+        states = []
+        recorder.on_state_change(states.append)
+
+        recorder.start_recording("First")
+        recorder.start_recording("Second")
+
+        assert states == [RecordingState.RECORDING, RecordingState.RECORDING]
+
+    def test_playback_end_notifies_once(self):
+        """回放结束后再调用 stop_playback 不应重复通知"""
+        recorder = GestureRecorder()
+        states = []
+        done = threading.Event()
+        recorder.on_state_change(states.append)
+
+        recorder.play(make_recording([0.0]), on_complete=done.set)
+        assert done.wait(2.0)
+        recorder.stop_playback()
+
+        assert states == [RecordingState.PLAYING, RecordingState.IDLE]
+
+    def test_stop_playback_keeps_recording(self):
+        """未回放时调用 stop_playback 不应打断录制"""
+        recorder = GestureRecorder()
+        recorder.start_recording()
+        recorder.stop_playback()
+
+        assert recorder.is_recording
+
+
+# 运行测试
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
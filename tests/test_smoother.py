@@ -8,10 +8,16 @@ import math
 import time
 from typing import List, Tuple
 
+import numpy as np
 import pytest
 
 # conftest.py 已经设置了正确的导入路径
-from src.tracker.smoother import LowPassFilter, OneEuroFilter, Smoother
+from src.tracker.smoother import (
+    LowPassFilter,
+    OneEuroFilter,
+    Smoother,
+    _one_euro_step,
+)
 
 
 class TestLowPassFilter:
@@ -304,10 +310,8 @@ class TestSmoother:
         smoother.set_params(min_cutoff=0.5, beta=0.01)
 
         # 参数应该被更新
-        assert smoother._x_filter.min_cutoff == 0.5
-        assert smoother._x_filter.beta == 0.01
-        assert smoother._y_filter.min_cutoff == 0.5
-        assert smoother._y_filter.beta == 0.01
+        assert smoother.min_cutoff == 0.5
+        assert smoother.beta == 0.01
 
     def test_smooth_trajectory(self, smoother):
         """测试轨迹平滑"""
@@ -486,6 +490,137 @@ class TestFilterParameters:
         assert 0.0 <= x <= 1.0 or x > 0.0  # 应该在合理范围内
 
 
+class TestOneEuroStep:
+    """测试融合的 (x, y) One Euro 滤波内核"""
+
+    def test_matches_independent_filters(self):
+        """与两个独立 OneEuroFilter 的结果一致"""
+        fx = OneEuroFilter(min_cutoff=0.8, beta=0.4)
+        fy = OneEuroFilter(min_cutoff=0.8, beta=0.4)
+        state = np.zeros(6, dtype=np.float64)
+
+        for i in range(200):
+            t = i / 30.0
+            x = 0.5 + 0.3 * math.sin(i / 7.0)
+            y = 0.5 + 0.2 * math.cos(i / 5.0)
+            sx, sy = _one_euro_step(x, y, t, state, 0.8, 0.4, 1.0)
+            assert sx == pytest.approx(fx.filter(x, t), abs=1e-12)
+            assert sy == pytest.approx(fy.filter(y, t), abs=1e-12)
+
+    def test_first_value_passes_through(self):
+        """第一个值直接通过"""
+        state = np.zeros(6, dtype=np.float64)
+        assert _one_euro_step(0.3, 0.7, 1.0, state, 0.8, 0.4, 1.0) == (0.3, 0.7)
+
+    def test_list_state(self):
+        """纯 Python 列表状态与 numpy 状态结果一致"""
+        array_state = np.zeros(6, dtype=np.float64)
+        list_state = [0.0] * 6
+
+        for i in range(50):
+            t = i / 30.0
+            x = 0.5 + 0.3 * math.sin(i / 7.0)
+            y = 0.5 + 0.2 * math.cos(i / 5.0)
+            expected = _one_euro_step(x, y, t, array_state, 0.8, 0.4, 1.0)
+            assert _one_euro_step(x, y, t, list_state, 0.8, 0.4, 1.0) == expected
+
+
+class TestSmoothBatch:
+    """测试批量平滑"""
+
+    def test_matches_independent_filters(self):
+        """与逐个坐标使用 OneEuroFilter 的结果一致"""
+        smoother = Smoother(smoothing=0.5)
+        params = smoother.params
+        filters = [
+            [
+                OneEuroFilter(params.min_cutoff, params.beta, params.d_cutoff)
+                for _ in range(2)
+            ]
+            for _ in range(21)
+        ]
+
+        rng = np.random.default_rng(0)
+        for i in range(60):
+            t = i / 30.0
+            points = rng.random((21, 2))
+            result = smoother.smooth_batch(points, t)
+            for n in range(21):
+                for axis in range(2):
+                    expected = filters[n][axis].filter(points[n, axis], t)
+                    assert result[n, axis] == pytest.approx(expected, abs=1e-12)
+
+    def test_first_batch_passes_through(self):
+        """第一批坐标直接通过"""
+        smoother = Smoother()
+        points = np.array([[0.1, 0.2], [0.3, 0.4]])
+        np.testing.assert_array_equal(smoother.smooth_batch(points, 0.0), points)
+
+    def test_reset_and_shape_change(self):
+        """重置或点数变化后重新开始"""
+        smoother = Smoother()
+        smoother.smooth_batch(np.zeros((3, 2)), 0.0)
+        ones = np.ones((3, 2))
+        assert not np.array_equal(smoother.smooth_batch(ones, 0.03), ones)
+
+        smoother.reset()
+        np.testing.assert_array_equal(smoother.smooth_batch(ones, 0.06), ones)
+
+        fewer = np.full((2, 2), 0.5)
+        np.testing.assert_array_equal(smoother.smooth_batch(fewer, 0.09), fewer)
+
+
+class TestSmoothSeries:
+    """测试按时间顺序批量平滑"""
+
+    def test_matches_step_by_step(self):
+        """与逐个样本调用融合内核的结果一致"""
+        smoother = Smoother(smoothing=0.5)
+        params = smoother.params
+        ts = np.arange(100) / 30.0
+        xs = 0.5 + 0.3 * np.sin(np.arange(100) / 7.0)
+        ys = 0.5 + 0.2 * np.cos(np.arange(100) / 5.0)
+
+        out_x, out_y = smoother.smooth_series(xs, ys, ts)
+
+        state = [0.0] * 6
+        for i in range(100):
+            sx, sy = _one_euro_step(
+                xs[i], ys[i], ts[i], state, params.min_cutoff, params.beta, 1.0
+            )
+            assert out_x[i] == pytest.approx(sx, abs=1e-12)
+            assert out_y[i] == pytest.approx(sy, abs=1e-12)
+
+    def test_continues_live_state(self):
+        """与 smooth() 共用滤波状态"""
+        smoother = Smoother()
+        reference = Smoother()
+        smoother.smooth(0.2, 0.2, 0.0)
+        reference.smooth(0.2, 0.2, 0.0)
+
+        out_x, out_y = smoother.smooth_series([0.4, 0.6], [0.4, 0.6], [0.03, 0.06])
+        reference.smooth(0.4, 0.4, 0.03)
+        expected = reference.smooth(0.6, 0.6, 0.06)
+        assert (out_x[-1], out_y[-1]) == pytest.approx(expected, abs=1e-12)
+
+
+class TestSmoothingPresets:
+    """测试预设参数"""
+
+    def test_setters_do_not_modify_shared_preset(self):
+        """修改参数不会影响其他平滑器共享的预设"""
+        first = Smoother()
+        second = Smoother()
+        first.min_cutoff = 0.1
+        first.beta = 0.9
+
+        assert first.min_cutoff == 0.1
+        assert first.beta == 0.9
+        assert second.min_cutoff == 0.8
+        assert second.beta == 0.4
+        assert Smoother().params == second.params
+
+
 # 运行测试
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])